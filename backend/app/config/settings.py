@@ -2,8 +2,11 @@
 Application Settings & Configuration
 Centralized configuration management for Wevolve API
 """
+from operator import itemgetter
 from typing import List
 
+import numpy as np
+
 
 class Settings:
     """Application settings - can be extended to use environment variables"""
@@ -15,6 +18,8 @@ class Settings:
     
     # Database
     DATABASE_URL: str = "sqlite:///./wevolve.db"
+    # Create missing tables on startup; disable when the schema is managed externally
+    AUTO_CREATE_TABLES: bool = True
     
     # CORS Origins
     CORS_ORIGINS: List[str] = [
@@ -34,6 +39,13 @@ class Settings:
         "role": 0.10         # 10%
     }
     
+    # Same weights as a vector in scoring-component order, for `components @ WEIGHTS_VEC`
+    WEIGHTS_VEC: np.ndarray = np.array(
+        itemgetter("skills", "location", "salary", "experience", "role")(MATCHING_WEIGHTS),
+        dtype=np.float64
+    )
+    WEIGHTS_VEC.setflags(write=False)
+    
     # Match Tier Thresholds
     MATCH_TIERS: dict = {
         "excellent": 85,
@@ -1,3 +1,3 @@
 """Database module for Wevolve API"""
 from .database import engine, SessionLocal, Base, get_db, init_db
-from .models import Candidate, JobPosting, Skill, User
+from .models import Candidate, JobPosting, Skill, User, Location, Role
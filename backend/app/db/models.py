@@ -2,8 +2,8 @@
 SQLAlchemy ORM Models for Wevolve
 Defines database schema for Candidates, Jobs, and Skills
 """
-from sqlalchemy import Column, Integer, String, Float, Text, JSON, ForeignKey, Table, Boolean, SmallInteger
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, Text, JSON, ForeignKey, Table, Boolean, SmallInteger, Index
+from sqlalchemy.orm import relationship, deferred
 
 from .database import Base
 
@@ -16,7 +16,21 @@ candidate_skills = Table(
     Base.metadata,
     Column('candidate_id', Integer, ForeignKey('candidates.id'), primary_key=True),
     Column('skill_id', Integer, ForeignKey('skills.id'), primary_key=True),
-    Column('proficiency_level', Integer, default=1)  # 1-5 scale
+    Column('proficiency_level', SmallInteger, default=1)  # 1-5 scale
+)
+
+candidate_preferred_locations = Table(
+    'candidate_preferred_locations',
+    Base.metadata,
+    Column('candidate_id', Integer, ForeignKey('candidates.id'), primary_key=True),
+    Column('location_id', Integer, ForeignKey('locations.id'), primary_key=True)
+)
+
+candidate_preferred_roles = Table(
+    'candidate_preferred_roles',
+    Base.metadata,
+    Column('candidate_id', Integer, ForeignKey('candidates.id'), primary_key=True),
+    Column('role_id', Integer, ForeignKey('roles.id'), primary_key=True)
 )
 
 
@@ -35,6 +49,22 @@ class Skill(Base):
     prerequisites = Column(JSON, default=[])
 
 
+class Location(Base):
+    """Dictionary of location names, referenced by integer id"""
+    __tablename__ = "locations"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(200), unique=True, nullable=False, index=True)
+
+
+class Role(Base):
+    """Dictionary of role names, referenced by integer id"""
+    __tablename__ = "roles"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(200), unique=True, nullable=False, index=True)
+
+
 class Candidate(Base):
     """Candidate profile parsed from resume"""
     __tablename__ = "candidates"
@@ -53,7 +83,7 @@ class Candidate(Base):
     expected_salary_min = Column(Integer)
     expected_salary_max = Column(Integer)
     
-    # Preferences (JSON lists)
+    # Preferences (JSON lists) - kept alongside the normalized relationships below for backfill
     preferred_locations = Column(JSON, default=[])
     preferred_roles = Column(JSON, default=[])
     
@@ -65,16 +95,25 @@ class Candidate(Base):
     confidence_scores = Column(JSON, default={})
     
     # Raw Data
-    raw_resume_text = Column(Text)
+    # deferred: the full resume body is only loaded when the attribute is accessed
+    raw_resume_text = deferred(Column(Text))
     resume_file_path = Column(String(500))
     
     # Relationships
-    skills = relationship("Skill", secondary=candidate_skills, backref="candidates")
+    # selectin: load skills for a batch of candidates with one IN query instead of one per row
+    skills = relationship("Skill", secondary=candidate_skills, backref="candidates", lazy="selectin")
+    # Default lazy loading: only the profile write path touches these, so reads don't pay two extra SELECTs
+    preferred_location_refs = relationship("Location", secondary=candidate_preferred_locations)
+    preferred_role_refs = relationship("Role", secondary=candidate_preferred_roles)
 
 
 class JobPosting(Base):
     """Job posting storage that mirrors jobs.json structure"""
     __tablename__ = "job_postings"
+    __table_args__ = (
+        # Covers location filters combined with salary range checks
+        Index("ix_job_loc_sal", "location", "salary_min", "salary_max"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False, index=True)
@@ -7,14 +7,17 @@ Three Core Modules:
 2. Transparent Matching - Multi-factor job matching with explanations
 3. Actionable Growth - Personalized learning roadmaps
 """
-import json
-from pathlib import Path
+import os
+from sqlalchemy import text
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import settings
-from .db import init_db
+from .db import engine, init_db
 from .routers import resume, matching, roadmap, auth
+from .services import scoring_kernel
+from .services.job_catalog import load_jobs
 
 # ============================================================
 # Application Setup
@@ -25,7 +28,8 @@ app = FastAPI(
     description=settings.APP_DESCRIPTION,
     version=settings.APP_VERSION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
@@ -52,8 +56,12 @@ app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 async def startup_event():
     """Initialize database on application startup."""
     print("🚀 Wevolve API Starting...")
-    init_db()
-    print("✅ Database initialized successfully!")
+    if settings.AUTO_CREATE_TABLES:
+        init_db()
+        print("✅ Database initialized successfully!")
+    os.makedirs(auth.UPLOAD_DIR, exist_ok=True)
+    # JIT-compile the matching kernel before the first request instead of at import
+    scoring_kernel.warm_up()
 
 
 # ============================================================
@@ -80,11 +88,9 @@ async def root():
 async def health_check():
     """Detailed health check with database connectivity test."""
     try:
-        from .db import SessionLocal
-        from sqlalchemy import text
-        db = SessionLocal()
-        db.execute(text("SELECT 1"))
-        db.close()
+        # Borrow a pooled connection instead of building a full ORM session
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
         
         return {
             "status": "ok",
@@ -109,11 +115,7 @@ async def get_jobs():
     """
     Return all available jobs from the jobs.json file.
     """
-    jobs_file = Path(__file__).parent.parent / "data" / "jobs.json"
-    
     try:
-        with open(jobs_file, 'r') as f:
-            data = json.load(f)
-            return {"jobs": data.get('jobs', [])}
+        return {"jobs": load_jobs()}
     except FileNotFoundError:
         return {"jobs": []}
\ No newline at end of file
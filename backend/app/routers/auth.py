@@ -1,8 +1,14 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
+import hashlib
+import logging
 import os
-import shutil
+import tempfile
+import threading
+import time
 from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -11,22 +17,26 @@ from dotenv import load_dotenv
 
 from ..db import models
 from .. import schemas
-from ..db.database import get_db, engine
+from ..db.database import get_db
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "YOUR_SUPER_SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+# Seconds a verified token's claims are reused before decoding again (0 disables the cache)
+AUTH_VERIFY_CACHE_TTL = float(os.getenv("AUTH_VERIFY_CACHE_TTL", 5))
+AUTH_VERIFY_CACHE_SIZE = 10_000
+# bcrypt cost factor: hashing time doubles with each extra round
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
 
 router = APIRouter()
 
-# Create DB tables if they don't exist
-models.Base.metadata.create_all(bind=engine)
-
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=BCRYPT_ROUNDS, deprecated="auto")
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -51,32 +61,67 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+# sha256(token) -> (cached until, decoded payload), oldest first
+_verified_tokens: "OrderedDict[bytes, tuple]" = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    jwt.decode with a short-lived cache so repeat requests with the same token
+    skip signature verification. Raises JWTError like jwt.decode.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.monotonic()
+    with _verified_tokens_lock:
+        cached = _verified_tokens.get(key)
+        if cached and cached[0] > now and cached[1].get("exp", 0) > time.time():
+            _verified_tokens.move_to_end(key)
+            return cached[1]
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+    if AUTH_VERIFY_CACHE_TTL > 0:
+        with _verified_tokens_lock:
+            _verified_tokens[key] = (now + AUTH_VERIFY_CACHE_TTL, payload)
+            _verified_tokens.move_to_end(key)
+            if len(_verified_tokens) > AUTH_VERIFY_CACHE_SIZE:
+                _verified_tokens.popitem(last=False)
+    return payload
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        print(f"DEBUG: Verifying token: {token[:10]}...")
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print(f"DEBUG: Payload: {payload}")
-        email: str = payload.get("sub")
-        if email is None:
-            print("DEBUG: Email is None")
+        payload = decode_access_token(token)
+        subject: str = payload.get("sub")
+        if subject is None:
+            logger.debug("Token has no subject")
             raise credentials_exception
-        token_data = schemas.TokenData(email=email)
+        # sub is the user id; tokens issued before that change carry the email instead
+        if subject.isdigit():
+            token_data = schemas.TokenData(user_id=int(subject), email=payload.get("email"))
+        else:
+            token_data = schemas.TokenData(email=subject)
     except JWTError as e:
-        print(f"DEBUG: JWTError: {e}")
+        logger.debug("Token rejected: %s", e)
         raise credentials_exception
     
-    user = db.query(models.User).filter(models.User.email == token_data.email).first()
+    if token_data.user_id is not None:
+        # Primary-key lookup, served from the session identity map when already loaded
+        user = db.get(models.User, token_data.user_id)
+    else:
+        user = db.query(models.User).filter(models.User.email == token_data.email).first()
     if user is None:
-        print("DEBUG: User not found in DB")
+        logger.debug("Token subject %s not found", token_data.user_id or token_data.email)
         raise credentials_exception
     
     if user.is_deleted == 1:
-        print("DEBUG: User is deleted")
+        logger.debug("Token subject %s is deleted", user.id)
         raise credentials_exception
         
     return user
@@ -121,7 +166,7 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": str(user.id), "email": user.email}, expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -188,7 +233,42 @@ def delete_my_profile(
     return None
 
 
-UPLOAD_DIR = "app/static/uploads"
+UPLOAD_DIR = "app/static/uploads"  # created at startup
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def save_upload(upload: UploadFile, prefix: str) -> str:
+    """
+    Copy an uploaded file into UPLOAD_DIR in 1 MB chunks and return its filename.
+    The name is derived from a hash of the content, so re-uploading the same file
+    reuses the stored copy. Blocking; run it via run_in_threadpool.
+    """
+    file_extension = upload.filename.split(".")[-1]
+    digest = hashlib.sha256()
+    with tempfile.NamedTemporaryFile(dir=UPLOAD_DIR, delete=False) as buffer:
+        try:
+            while chunk := upload.file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                buffer.write(chunk)
+        except BaseException:
+            # UPLOAD_DIR is publicly served; don't leave a partial temp file behind
+            buffer.close()
+            os.remove(buffer.name)
+            raise
+
+    filename = f"{prefix}_{digest.hexdigest()[:16]}.{file_extension}"
+    file_path = os.path.join(UPLOAD_DIR, filename)
+    try:
+        if os.path.exists(file_path):
+            os.remove(buffer.name)
+        else:
+            os.replace(buffer.name, file_path)
+    except BaseException:
+        if os.path.exists(buffer.name):
+            os.remove(buffer.name)
+        raise
+    return filename
+
 
 @router.post("/me/profile-photo", response_model=schemas.UserOut)
 async def upload_profile_photo(
@@ -197,22 +277,14 @@ async def upload_profile_photo(
     db: Session = Depends(get_db)
 ):
     """Upload profile photo."""
-    if not os.path.exists(UPLOAD_DIR):
-        os.makedirs(UPLOAD_DIR)
-    
-    # Generate unique filename
-    file_extension = file.filename.split(".")[-1]
-    filename = f"profile_{current_user.id}_{datetime.now().timestamp()}.{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, filename)
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    filename = await run_in_threadpool(save_upload, file, f"profile_{current_user.id}")
     
-    # Save relative path to DB (accessible via /static/uploads/...)
+    # Save relative path to DB (accessible via /static/uploads/...); unchanged when the same photo is re-uploaded
     relative_path = f"/static/uploads/{filename}"
-    current_user.profile_photo = relative_path
-    db.commit()
-    db.refresh(current_user)
+    if current_user.profile_photo != relative_path:
+        current_user.profile_photo = relative_path
+        db.commit()
+        db.refresh(current_user)
     return current_user
 
 
@@ -223,20 +295,12 @@ async def upload_cover_photo(
     db: Session = Depends(get_db)
 ):
     """Upload cover photo."""
-    if not os.path.exists(UPLOAD_DIR):
-        os.makedirs(UPLOAD_DIR)
-    
-    # Generate unique filename
-    file_extension = file.filename.split(".")[-1]
-    filename = f"cover_{current_user.id}_{datetime.now().timestamp()}.{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, filename)
+    filename = await run_in_threadpool(save_upload, file, f"cover_{current_user.id}")
     
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    # Save relative path to DB
+    # Save relative path to DB; unchanged when the same photo is re-uploaded
     relative_path = f"/static/uploads/{filename}"
-    current_user.cover_photo = relative_path
-    db.commit()
-    db.refresh(current_user)
+    if current_user.cover_photo != relative_path:
+        current_user.cover_photo = relative_path
+        db.commit()
+        db.refresh(current_user)
     return current_user
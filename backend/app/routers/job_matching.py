@@ -1,15 +1,52 @@
-import json
 import os
+
+import orjson
 from thefuzz import process, fuzz
 
 # Load jobs data
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 jobs_path = os.path.normpath(os.path.join(BASE_DIR, "..", "..", "data", "jobs.json"))
 
-with open(jobs_path, "r") as f:
-    data = json.load(f)
+# Own copy of the jobs (not the shared services.job_catalog cache): the skill masks
+# below are written onto these dicts
+with open(jobs_path, "rb") as f:
+    data = orjson.loads(f.read())
     jobs = data.get("jobs", [])
 
+MATCH_THRESHOLD = 85
+
+# Skill vocabulary over all jobs: skill name -> bit position.
+# Each job's required skills are encoded once as an integer bitmask.
+SKILL_VOCAB = {}
+for _job in jobs:
+    _mask = 0
+    for _skill in _job.get('required_skills', []):
+        _mask |= 1 << SKILL_VOCAB.setdefault(_skill, len(SKILL_VOCAB))
+    _job['_skill_mask'] = _mask
+
+def fuzzy_has_skill(skill, can_skills):
+    """True when one of the candidate's skills fuzzy-matches the skill."""
+    match = process.extractOne(skill, can_skills, scorer=fuzz.token_set_ratio)
+    return bool(match and match[1] >= MATCH_THRESHOLD)
+
+
+def encode_skills(can_skills):
+    """Bitmask of the vocabulary skills the candidate fuzzy-matches."""
+    mask = 0
+    for skill, bit in SKILL_VOCAB.items():
+        if fuzzy_has_skill(skill, can_skills):
+            mask |= 1 << bit
+    return mask
+
+
+def encode_job_skills(req_skills):
+    """Bitmask of a job's required skills that are in the vocabulary."""
+    mask = 0
+    for skill in req_skills:
+        if skill in SKILL_VOCAB:
+            mask |= 1 << SKILL_VOCAB[skill]
+    return mask
+
 
 # candidate =  {
 #     "skills": ["Python3", "FastAPI", "Docker", "ReactJS"], 
@@ -25,23 +62,26 @@ with open(jobs_path, "r") as f:
 # }
 
 
-def calculate_match(candidate, job):
+def calculate_match(candidate, job, candidate_mask=None):
     # 1. Skill Match & Missing Skills using Fuzzy Matching
-    MATCH_THRESHOLD = 85
+    # Pass candidate_mask (from encode_skills) when scoring one candidate against many jobs
     req_skills = job.get('required_skills', [])
-    can_skills = candidate.get('skills', [])
+    if candidate_mask is None:
+        candidate_mask = encode_skills(candidate.get('skills', []))
     
-    matched_skills = []
-    missing_skills = []
-    
-    for req in req_skills:
-        match = process.extractOne(req, can_skills, scorer=fuzz.token_set_ratio)
-        if match and match[1] >= MATCH_THRESHOLD:
-            matched_skills.append(req)
-        else:
-            missing_skills.append(req)
+    # Jobs from jobs.json carry a precomputed mask; encode any other job dict on the fly
+    job_mask = job.get('_skill_mask')
+    if job_mask is None:
+        job_mask = encode_job_skills(req_skills)
+    matched_mask = candidate_mask & job_mask
+    # Skills outside the vocabulary have no bit, so they are fuzzy-matched directly
+    missing_skills = [
+        req for req in req_skills
+        if not (matched_mask >> SKILL_VOCAB[req] & 1 if req in SKILL_VOCAB
+                else fuzzy_has_skill(req, candidate.get('skills', [])))
+    ]
     
-    skill_score = (len(matched_skills) / len(req_skills)) * 100 if req_skills else 100
+    skill_score = ((len(req_skills) - len(missing_skills)) / len(req_skills)) * 100 if req_skills else 100
 
     # 2. Location Match
     loc_match = 100 if job['location'] in candidate['preferred_locations'] else 0
@@ -102,8 +142,9 @@ if __name__ == "__main__":
     print(f"Skills: {', '.join(candidate['skills'])}")
     print("-" * 50)
 
+    candidate_mask = encode_skills(candidate['skills'])
     for job in jobs:
-        result = calculate_match(candidate, job)
+        result = calculate_match(candidate, job, candidate_mask)
         print(f"Job: {result['job_title']} (ID: {result['job_id']})")
         print(f"Score: {result['match_score']}%")
         print(f"Skill Match: {result['breakdown']['skill_match']}%")
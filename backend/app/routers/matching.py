@@ -1,26 +1,161 @@
-from fastapi import APIRouter, HTTPException, Depends
+import logging
+import threading
+import time
+from functools import lru_cache
+from itertools import chain
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
 from ..db import get_db, JobPosting
 from ..schemas.matching import MatchRequest, MatchResponse, JobMatch
-from ..services.matching_service import MatchingEngine
+from ..services import get_matching_engine
+from ..services.matching_service import MatchingEngine, JobCorpus
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/matching", tags=["Transparent Matching"])
 
-# Service instance
-engine = MatchingEngine()
+# Job corpus is built from the database on first use and reused across requests.
+# Job posting writes committed through a Session in this process invalidate it;
+# the TTL picks up writes made elsewhere.
+CORPUS_TTL_SECONDS = 60
+_corpus: Optional[JobCorpus] = None
+_corpus_loaded_at = 0.0
+# Serializes reloads so concurrent requests after an invalidation build the corpus once
+_corpus_lock = threading.Lock()
+
+
+def _corpus_is_fresh(corpus: Optional[JobCorpus], loaded_at: float) -> bool:
+    """True when a cached corpus exists and is younger than the TTL."""
+    return corpus is not None and time.monotonic() - loaded_at <= CORPUS_TTL_SECONDS
+
+
+def get_job_corpus(db: Session) -> JobCorpus:
+    """Return the cached job corpus, loading it from the database if needed."""
+    global _corpus, _corpus_loaded_at
+    corpus, loaded_at = _corpus, _corpus_loaded_at
+    if _corpus_is_fresh(corpus, loaded_at):
+        return corpus
+    with _corpus_lock:
+        # Another request may have reloaded while this one waited for the lock
+        corpus, loaded_at = _corpus, _corpus_loaded_at
+        if _corpus_is_fresh(corpus, loaded_at):
+            return corpus
+        # Core select: plain rows, no ORM instances to build and track
+        rows = db.execute(select(
+            JobPosting.id,
+            JobPosting.title,
+            JobPosting.required_skills,
+            JobPosting.nice_to_have_skills,
+            JobPosting.location,
+            JobPosting.salary_min,
+            JobPosting.salary_max,
+            JobPosting.min_experience_years
+        )).mappings().all()
+        corpus = JobCorpus([dict(row) for row in rows])
+        if not corpus.size:
+            return corpus  # Don't cache an empty catalogue
+        invalidate_job_corpus()  # Scores cached against the old corpus are stale
+        _corpus, _corpus_loaded_at = corpus, time.monotonic()
+    # Return the local: a concurrent invalidate may already have reset the global
+    return corpus
+
+
+def invalidate_job_corpus() -> None:
+    """Drop the cached corpus so the next request reloads job postings."""
+    global _corpus
+    _corpus = None
+    _score_candidate.cache_clear()
+
+
+# Writes only mark the session; the corpus is dropped once they are committed, so a
+# reload can never pick up rows that are later rolled back
+_JOB_POSTINGS_CHANGED = "job_postings_changed"
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flushed_job_postings(session: Session, flush_context) -> None:
+    """Flag the session when a flush inserts, updates or deletes a job posting."""
+    if any(isinstance(obj, JobPosting) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info[_JOB_POSTINGS_CHANGED] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_bulk_job_postings(orm_execute_state) -> None:
+    """Flag the session for bulk and Core insert/update/delete statements on job postings."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if getattr(table, "name", None) == JobPosting.__tablename__:
+            orm_execute_state.session.info[_JOB_POSTINGS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _job_postings_committed(session: Session) -> None:
+    """Committed job posting writes make the cached corpus stale."""
+    if session.info.pop(_JOB_POSTINGS_CHANGED, False):
+        invalidate_job_corpus()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _job_postings_rolled_back(session: Session, previous_transaction) -> None:
+    """Writes discarded with the outermost transaction never reach the corpus."""
+    if previous_transaction.parent is None:
+        session.info.pop(_JOB_POSTINGS_CHANGED, None)
+
+
+def _candidate_key(candidate: dict) -> tuple:
+    """Canonical, hashable form of the fields that affect scoring."""
+    return (
+        tuple(sorted(set(candidate.get('skills') or []))),
+        float(candidate.get('experience_years') or 0),
+        tuple(candidate.get('preferred_locations') or []),
+        tuple(candidate.get('preferred_roles') or []),
+        MatchingEngine._expected_salary(candidate)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _score_candidate(engine: MatchingEngine, corpus: JobCorpus, key: tuple):
+    """
+    Score a canonical candidate against the corpus; repeat requests are served from cache.
+    The engine is part of the cache key, so an overridden engine never sees another's scores.
+    """
+    skills, experience_years, locations, roles, expected_salary = key
+    return engine.score_corpus({
+        "skills": list(skills),
+        "experience_years": experience_years,
+        "preferred_locations": list(locations),
+        "preferred_roles": list(roles),
+        "expected_salary": expected_salary
+    }, corpus)
 
 
 @router.post("/calculate", response_model=MatchResponse)
-async def calculate_matches(request: MatchRequest, db: Session = Depends(get_db)):
+def calculate_matches(
+    request: MatchRequest,
+    limit: Optional[int] = Query(None, ge=1, description="Return only the top N matches"),
+    offset: int = Query(0, ge=0, description="Skip this many ranked matches"),
+    min_tier: Optional[Literal["fair", "good", "excellent"]] = Query(
+        None, description="Return only matches at or above this tier"
+    ),
+    db: Session = Depends(get_db),
+    engine: MatchingEngine = Depends(get_matching_engine)
+):
     """
     Match a candidate against all available jobs from the database.
     Uses fuzzy matching for skills and roles.
+    Every job is scored, but explanations and response models are built only
+    for the requested page of the ranking.
+    Declared sync so FastAPI runs the DB load and CPU-bound scoring in its threadpool,
+    keeping the event loop free for other requests.
     """
-    # Load jobs from database
-    jobs = db.query(JobPosting).all()
+    corpus = get_job_corpus(db)
     
-    if not jobs:
+    if not corpus.size:
         raise HTTPException(status_code=404, detail="No job postings found in the database.")
     
     candidate_data = request.dict()
@@ -32,108 +167,61 @@ async def calculate_matches(request: MatchRequest, db: Session = Depends(get_db)
     elif isinstance(education_data, dict):
         field = education_data.get('field', 'Unknown')
     
-    # Visual console output
-    print(f"\n--- API Match Results for {field} Candidate ---")
-    print(f"Skills: {', '.join(candidate_data.get('skills', []))}")
-    print("-" * 50)
+    # Score every job in one vectorized pass, then rank by rounded score (stable for ties)
+    components, totals, skill_mask = _score_candidate(engine, corpus, _candidate_key(candidate_data))
+    order, rounded = engine.rank_jobs(totals, min_tier)
+    order = order[offset:None if limit is None else offset + limit]
+    scores = rounded[order].tolist()
+    tiers = engine.get_match_tiers(scores)
     
     results = []
     
-    for job in jobs:
-        # Convert model to dict for matching service compatibility
-        job_data = {
-            "id": job.id,
-            "title": job.title,
-            "required_skills": job.required_skills,
-            "nice_to_have_skills": job.nice_to_have_skills,
-            "location": job.location,
-            "salary_min": job.salary_min,
-            "salary_max": job.salary_max,
-            "min_experience_years": job.min_experience_years
-        }
-
-        # 1. Skill Match
-        skill_score, matching, missing_req, missing_opt = engine.calculate_skills_score(
-            candidate_data.get('skills', []),
-            job_data.get('required_skills', []),
-            job_data.get('nice_to_have_skills', [])
-        )
-        
-        # 2. Location Match
-        location_score = engine.calculate_location_score(
-            candidate_data.get('preferred_locations', []),
-            job_data.get('location', '') or ''
-        )
+    for rank, i in enumerate(order):
+        job = corpus.jobs[i]
+        skill_score, location_score, salary_score, experience_score, role_score = components[i].tolist()
+        missing_req = [
+            s for s in job.get('required_skills') or []
+            if not skill_mask[corpus.skill_vocab[s]]
+        ]
         
-        # 3. Salary Match
-        # Handle salary extraction from dict safely
-        exp_salary_data = candidate_data.get('expected_salary')
-        exp_salary_val = 0
-        if isinstance(exp_salary_data, dict):
-            exp_salary_val = exp_salary_data.get('min', 0)
-        elif isinstance(exp_salary_data, (int, float)):
-            exp_salary_val = exp_salary_data
-            
-        salary_score = engine.calculate_salary_score(
-            exp_salary_val,
-            job_data.get('salary_min') or 0,
-            job_data.get('salary_max') or 0
-        )
-        
-        # 4. Experience Match
-        experience_score = engine.calculate_experience_score(
-            candidate_data.get('experience_years') or 0,
-            job_data.get('min_experience_years') or 0
-        )
-        
-        # 5. Role Match
-        role_score = engine.calculate_role_score(
-            candidate_data.get('preferred_roles', []),
-            job_data.get('title', '')
-        )
-        
-        # Prepare breakdown dict for total score and generation
-        temp_result = {
-            "job_id": job.id,
-            "job_title": job.title,
-            "missing_skills": missing_req,
-            "breakdown": {
-                "skill_match": skill_score,
-                "location_match": location_score,
-                "salary_match": salary_score,
-                "experience_match": experience_score,
-                "role_match": role_score
-            }
+        breakdown = {
+            "skill_match": skill_score,
+            "location_match": location_score,
+            "salary_match": salary_score,
+            "experience_match": experience_score,
+            "role_match": role_score
         }
         
-        total_score = engine.calculate_total_score(temp_result['breakdown'])
-        explanation, top_reason, improve = engine.generate_explanation(temp_result)
+        total_score = scores[rank]
+        explanation, top_reason, improve = engine.generate_explanation(
+            {"breakdown": breakdown, "missing_skills": missing_req}
+        )
         
         job_match = JobMatch(
-            job_id=job.id,
-            job_title=job.title,
+            job_id=job['id'],
+            job_title=job['title'],
             match_score=total_score,
-            match_tier=engine.get_match_tier(total_score),
-            breakdown=temp_result['breakdown'],
+            match_tier=tiers[rank],
+            breakdown=breakdown,
             missing_skills=missing_req,
             explanation=explanation,
             top_reason_for_match=top_reason,
             top_area_to_improve=improve
         )
         
-        # Console logging
-        print(f"Job: {job.title} (ID: {job.id})")
-        print(f"Score: {total_score}%")
-        print(f"Skill Match: {skill_score}% | Location: {location_score}% | Salary: {salary_score}%")
-        print("-" * 30)
-        
         results.append(job_match)
     
-    # Sort results by score descending
-    results.sort(key=lambda x: x.match_score, reverse=True)
+    logger.debug(
+        "Matched %s candidate (%d skills) against %d jobs; top=%s",
+        field, len(candidate_data.get('skills', [])), len(results),
+        results[0].match_score if results else None
+    )
     
-    return MatchResponse(
+    response = MatchResponse(
         candidate=candidate_data.get('full_name', 'Candidate'),
         field=field,
         matches=results
     )
+    # Serialize the validated model directly; returning a Response skips FastAPI's
+    # response_model pass, which would dump and re-validate every JobMatch again
+    return ORJSONResponse(response.model_dump(mode="json"))
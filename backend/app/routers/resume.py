@@ -2,43 +2,95 @@
 Resume Intelligence Router
 Simplified API endpoints - business logic delegated to services
 """
+from typing import BinaryIO, Callable, Dict
+
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from ..db import get_db, Candidate
+from ..db import get_db, Candidate, Location, Role
 from ..schemas import ParsedResume, ExtractedField
-from ..services import ResumeParser
+from ..schemas.resume import EDUCATION_LIST_ADAPTER, WORK_EXPERIENCE_LIST_ADAPTER, PROJECT_LIST_ADAPTER
+from ..services import ResumeParser, get_parser
 
 router = APIRouter(prefix="/api/resume", tags=["Resume Intelligence"])
 
-parser = ResumeParser()
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
 
 
-@router.post("/parse", response_model=ParsedResume)
-async def parse_resume(file: UploadFile = File(...), db: Session = Depends(get_db)):
+def _intern_names(db: Session, model, names):
     """
-    Parse an uploaded resume (PDF/DOCX) and extract structured data.
-    Saves the initial parse to the database and returns the result.
+    Return rows of a name dictionary table (Location/Role), inserting unseen names.
+    Safe against concurrent saves adding the same new name: a name another request
+    inserted first is skipped and then read back instead of failing the unique constraint.
     """
-    allowed_types = {
-        "application/pdf": "pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx"
-    }
-    
-    if file.content_type not in allowed_types:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type: {file.content_type}. Please upload PDF or DOCX."
-        )
-    
-    content = await file.read()
-    file_type = allowed_types[file.content_type]
-    
-    try:
-        if file_type == "pdf":
-            text = parser.extract_text_from_pdf(content)
+    names = list(dict.fromkeys(n.strip() for n in names if n and n.strip()))
+    if not names:
+        return []
+    existing = {row.name: row for row in db.query(model).filter(model.name.in_(names))}
+    missing = [name for name in names if name not in existing]
+    if missing:
+        upsert_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if upsert_insert is not None:
+            db.execute(
+                upsert_insert(model).values([{"name": name} for name in missing]).on_conflict_do_nothing()
+            )
         else:
-            text = parser.extract_text_from_docx(content)
+            for name in missing:
+                try:
+                    with db.begin_nested():
+                        db.add(model(name=name))
+                except IntegrityError:
+                    pass  # Inserted concurrently; read back below
+        existing.update((row.name, row) for row in db.query(model).filter(model.name.in_(missing)))
+    return [existing[name] for name in names]
+
+
+def _sanitize_for_json(data):
+    """
+    Replace None values with empty strings for JSON serialization.
+    Copy-on-write: containers holding no None are returned as-is, so clean
+    entries are not rebuilt. The input is never modified.
+    """
+    if data is None:
+        return ""
+    if isinstance(data, dict):
+        cleaned = None
+        for key, value in data.items():
+            new_value = _sanitize_for_json(value)
+            if new_value is not value:
+                if cleaned is None:
+                    cleaned = dict(data)
+                cleaned[key] = new_value
+        return data if cleaned is None else cleaned
+    if isinstance(data, list):
+        cleaned = None
+        for i, item in enumerate(data):
+            new_item = _sanitize_for_json(item)
+            if new_item is not item:
+                if cleaned is None:
+                    cleaned = list(data)
+                cleaned[i] = new_item
+        return data if cleaned is None else cleaned
+    return data
+
+
+# Accepted upload content types -> text extractor (static on ResumeParser)
+_EXTRACTORS: Dict[str, Callable[[BinaryIO], str]] = {
+    "application/pdf": ResumeParser.extract_text_from_pdf,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ResumeParser.extract_text_from_docx,
+}
+
+
+def _parse_document(parser: ResumeParser, content: BinaryIO, extractor: Callable[[BinaryIO], str]):
+    """Extract text from a PDF/DOCX upload and parse every field. Returns (text, parsed)."""
+    try:
+        text = extractor(content)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error parsing file: {str(e)}")
     
@@ -48,68 +100,66 @@ async def parse_resume(file: UploadFile = File(...), db: Session = Depends(get_d
             detail="Could not extract sufficient text from the document."
         )
     
-    # Extract all fields using service
-    parsed = {
-        'full_name': parser.extract_name(text),
-        'email': parser.extract_email(text),
-        'phone': parser.extract_phone(text),
-        'years_of_experience': parser.extract_experience_years(text),
-        'skills': parser.extract_skills(text),
-        'education': parser.extract_education(text),
-        'work_experience': parser.extract_work_experience(text),
-        'projects': parser.extract_projects(text),
-    }
+    return text, parser.parse_fields(text)
+
+
+@router.post("/parse", response_model=ParsedResume)
+async def parse_resume(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    parser: ResumeParser = Depends(get_parser)
+):
+    """
+    Parse an uploaded resume (PDF/DOCX) and extract structured data.
+    Saves the initial parse to the database and returns the result.
+    """
+    extractor = _EXTRACTORS.get(file.content_type)
+    if extractor is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type: {file.content_type}. Please upload PDF or DOCX."
+        )
+    
+    # The multipart parser has already streamed the body into a SpooledTemporaryFile
+    # (memory up to 1 MB, disk beyond). Hand that file object to the extractors
+    # instead of copying the whole upload into a bytes object with file.read().
+    await file.seek(0)
     
-    # Initialize preference fields (can be updated manually later)
-    # If using Python 3.9+, use union operator |, else iterate
-    parsed_with_defaults = parsed.copy()
-    parsed_with_defaults['preferred_locations'] = []
-    parsed_with_defaults['preferred_roles'] = []
-    parsed_with_defaults['expected_salary'] = None
+    # Extraction and parsing are CPU-bound; run them off the event loop so uploads overlap
+    text, parsed = await run_in_threadpool(_parse_document, parser, file.file, extractor)
     
     overall_confidence = parser.calculate_overall_confidence(parsed)
     
     # --- SANITIZE DATA BEFORE SAVING ---
-    def sanitize_for_json(data):
-        """Recursively replace None values with empty strings for JSON serialization."""
-        if isinstance(data, dict):
-            return {k: sanitize_for_json(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [sanitize_for_json(item) for item in data]
-        elif data is None:
-            return ""
-        return data
-    
-    sanitized_education = sanitize_for_json(parsed['education'])
-    sanitized_work_experience = sanitize_for_json(parsed['work_experience'])
-    sanitized_projects = sanitize_for_json(parsed['projects'])
-    
-    # Update parsed with sanitized projects
-    parsed['projects'] = sanitized_projects
+    sanitized_education = _sanitize_for_json(parsed['education'])
+    sanitized_work_experience = _sanitize_for_json(parsed['work_experience'])
+    sanitized_projects = _sanitize_for_json(parsed['projects'])
     
     # --- SAVE TO DB IMMEDIATELY ---
     try:
-        candidate = Candidate(
-            full_name=parsed['full_name'].value or "",
-            email=parsed['email'].value or "",
-            phone=parsed['phone'].value or "",
-            years_of_experience=parsed['years_of_experience'].value or 0,
-            raw_resume_text=text,
-            education=sanitized_education,
-            work_experience=sanitized_work_experience,
-            projects=sanitized_projects,
-            confidence_scores={
-                'full_name': parsed['full_name'].confidence,
-                'email': parsed['email'].confidence,
-                'overall': overall_confidence
-            },
-            # Initialize preferences as empty
-            preferred_locations=[],
-            preferred_roles=[]
-        )
-        db.add(candidate)
+        # Core INSERT .. RETURNING: no ORM instance or unit-of-work bookkeeping for a row
+        # this request never reads back, and the new id comes from the same statement
+        candidate_id = db.execute(
+            insert(Candidate).values(
+                full_name=parsed['full_name'].value or "",
+                email=parsed['email'].value or "",
+                phone=parsed['phone'].value or "",
+                years_of_experience=parsed['years_of_experience'].value or 0,
+                raw_resume_text=text,
+                education=sanitized_education,
+                work_experience=sanitized_work_experience,
+                projects=sanitized_projects,
+                confidence_scores={
+                    'full_name': parsed['full_name'].confidence,
+                    'email': parsed['email'].confidence,
+                    'overall': overall_confidence
+                },
+                # Initialize preferences as empty
+                preferred_locations=[],
+                preferred_roles=[]
+            ).returning(Candidate.id)
+        ).scalar_one()
         db.commit()
-        db.refresh(candidate)
     except Exception as db_error:
         db.rollback()
         raise HTTPException(
@@ -118,13 +168,17 @@ async def parse_resume(file: UploadFile = File(...), db: Session = Depends(get_d
         )
     
    
+    # Preference fields start empty and are filled in manually later
     response = ParsedResume(
-        **parsed_with_defaults,
+        **parsed,
+        preferred_locations=[],
+        preferred_roles=[],
+        expected_salary=None,
         overall_confidence=overall_confidence,
         raw_text=text[:2000]
     )
     
-    setattr(response, "id", candidate.id)
+    setattr(response, "id", candidate_id)
     
     return response
 
@@ -135,14 +189,11 @@ async def save_parsed_profile(
     profile: ParsedResume,
     db: Session = Depends(get_db)
 ):
-    """
-    Update a parsed profile with user corrections.
-    """
     """
     Update a parsed profile with user corrections.
     """
     try:
-        candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+        candidate = db.get(Candidate, candidate_id)
         
         if not candidate:
             raise HTTPException(
@@ -162,25 +213,26 @@ async def save_parsed_profile(
              candidate.years_of_experience = 0.0
         
         # Update Education - Convert models to dicts
-        candidate.education = [e.model_dump() for e in profile.education] if profile.education else []
+        candidate.education = EDUCATION_LIST_ADAPTER.dump_python(profile.education) if profile.education else []
         
         # Update Manual Preferences
         candidate.preferred_locations = profile.preferred_locations or []
         candidate.preferred_roles = profile.preferred_roles or []
+        candidate.preferred_location_refs = _intern_names(db, Location, candidate.preferred_locations)
+        candidate.preferred_role_refs = _intern_names(db, Role, candidate.preferred_roles)
         candidate.expected_salary_min = profile.expected_salary
         
         # We should also update work_experience if it's in the profile
         if profile.work_experience:
-             candidate.work_experience = [w.model_dump() for w in profile.work_experience]
+             candidate.work_experience = WORK_EXPERIENCE_LIST_ADAPTER.dump_python(profile.work_experience)
              
         # Update Projects
         if hasattr(profile, 'projects') and profile.projects:
-            candidate.projects = [p.model_dump() for p in profile.projects]
+            candidate.projects = PROJECT_LIST_ADAPTER.dump_python(profile.projects)
         
         db.commit()
-        db.refresh(candidate)
         
-        return {"message": "Profile updated successfully", "candidate_id": candidate.id}
+        return {"message": "Profile updated successfully", "candidate_id": candidate_id}
     except HTTPException:
         raise
     except Exception as e:
@@ -2,32 +2,66 @@
 Actionable Growth Router
 Simplified API endpoints - business logic delegated to services
 """
-import json
-from pathlib import Path
-from fastapi import APIRouter, HTTPException
+from functools import lru_cache
+from typing import Dict
+
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 
 from ..schemas.roadmap import RoadmapRequest, RoadmapResponse
-from ..services import RoadmapGenerator
+from ..services import RoadmapGenerator, get_roadmap_generator
+from ..services.job_catalog import load_jobs_by_id
 
 router = APIRouter(prefix="/api/roadmap", tags=["Actionable Growth"])
 
-# Service instance
-generator = RoadmapGenerator()
+# job id -> (job dict, ((skill, lowercased skill), ...)) for required + nice-to-have skills
+_skill_keys: Dict[int, tuple] = {}
+
+
+def _job_skill_keys(job: dict) -> tuple:
+    """Job skills paired with their lowercase form, computed once per loaded job."""
+    cached = _skill_keys.get(job['id'])
+    if cached is None or cached[0] is not job:  # new job or jobs.json reloaded
+        skills = job.get('required_skills', []) + job.get('nice_to_have_skills', [])
+        cached = (job, tuple((s, s.lower()) for s in skills))
+        _skill_keys[job['id']] = cached
+    return cached[1]
+
+
+def _render(response: RoadmapResponse) -> ORJSONResponse:
+    """
+    Serialize an already-validated response directly. Returning a Response skips
+    FastAPI's response_model pass, which would dump and re-validate the whole tree.
+    """
+    return ORJSONResponse(response.model_dump(mode="json"))
+
+
+@lru_cache(maxsize=1)
+def _skills_view(generator: RoadmapGenerator) -> Dict[str, dict]:
+    """Skill -> metadata summary of the static taxonomy, built once and shared by every /skills request."""
+    return {
+        skill: {
+            "category": data.get("category"),
+            "difficulty": data.get("difficulty"),
+            "prerequisites": data.get("prerequisites", []),
+            "estimated_weeks": data.get("estimated_weeks")
+        }
+        for skill, data in generator.SKILL_RESOURCES.items()
+    }
 
 
 @router.post("/generate", response_model=RoadmapResponse)
-async def generate_roadmap(request: RoadmapRequest):
+async def generate_roadmap(
+    request: RoadmapRequest,
+    generator: RoadmapGenerator = Depends(get_roadmap_generator)
+):
     """
     Generate a personalized learning roadmap based on skill gaps.
     Uses topological sorting to order skills by dependencies.
     """
-    # Load jobs data
-    jobs_file = Path(__file__).parent.parent.parent / "data" / "jobs.json"
-    
+    # Load jobs data (parsed once, reloaded when jobs.json changes)
     try:
-        with open(jobs_file, 'r') as f:
-            data = json.load(f)
-            jobs = {j['id']: j for j in data.get('jobs', [])}
+        jobs = load_jobs_by_id()
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Jobs data not found")
     
@@ -41,11 +75,11 @@ async def generate_roadmap(request: RoadmapRequest):
     required_skills = job.get('required_skills', [])
     optional_skills = job.get('nice_to_have_skills', [])
     all_job_skills = required_skills + optional_skills
-    missing_skills = [s for s in all_job_skills if s.lower() not in current_skills_lower]
+    missing_skills = [s for s, key in _job_skill_keys(job) if key not in current_skills_lower]
     
     # Handle perfect match case
     if not missing_skills:
-        return RoadmapResponse(
+        return _render(RoadmapResponse(
             target_job=job['title'],
             target_company=job['company'],
             current_match_score=100.0,
@@ -56,7 +90,7 @@ async def generate_roadmap(request: RoadmapRequest):
             total_estimated_hours=0,
             summary="Congratulations! You already have all the skills for this role.",
             motivation_message="🎉 You're ready to apply! Your skills are a perfect match."
-        )
+        ))
     
     # Sort skills by dependencies and build phases
     skill_phases = generator.topological_sort_skills(missing_skills)
@@ -77,7 +111,7 @@ async def generate_roadmap(request: RoadmapRequest):
         f"Estimated timeline: {weeks_text} at a {request.learning_pace} pace."
     )
     
-    return RoadmapResponse(
+    return _render(RoadmapResponse(
         target_job=job['title'],
         target_company=job['company'],
         current_match_score=round(current_score, 1),
@@ -88,18 +122,10 @@ async def generate_roadmap(request: RoadmapRequest):
         total_estimated_hours=total_hours,
         summary=summary,
         motivation_message=generator.get_motivation_message(len(missing_skills), total_weeks)
-    )
+    ))
 
 
 @router.get("/skills")
-async def get_available_skills():
+async def get_available_skills(generator: RoadmapGenerator = Depends(get_roadmap_generator)):
     """Get all skills in the taxonomy with their metadata"""
-    return {
-        skill: {
-            "category": data.get("category"),
-            "difficulty": data.get("difficulty"),
-            "prerequisites": data.get("prerequisites", []),
-            "estimated_weeks": data.get("estimated_weeks")
-        }
-        for skill, data in generator.SKILL_RESOURCES.items()
-    }
+    return _skills_view(generator)
@@ -1,24 +1,46 @@
 """Pydantic Schemas for API Request/Response models"""
-from .resume import ExtractedField, ParsedResume, ProfileUpdate, CandidateProfile
-from .matching import (
-    MatchRequest, 
-    MatchResponse, 
-    JobMatch, 
-    ScoreBreakdown, 
-    CandidateEducation
-)
-from .roadmap import (
-    RoadmapRequest, 
-    RoadmapResponse, 
-    LearningPhase, 
-    SkillNode, 
-    LearningResource
-)
-from .auth import (
-    Token,
-    TokenData,
-    UserCreate,
-    UserUpdate,
-    ChangePassword,
-    UserOut
-)
+import importlib
+
+# Public name -> defining submodule. Submodules are imported on first access
+# (PEP 562), so a process only builds the pydantic schemas it actually uses.
+_EXPORTS = {
+    # resume
+    "ExtractedField": "resume",
+    "ParsedResume": "resume",
+    "ProfileUpdate": "resume",
+    "CandidateProfile": "resume",
+    # matching
+    "MatchRequest": "matching",
+    "MatchResponse": "matching",
+    "JobMatch": "matching",
+    "ScoreBreakdown": "matching",
+    "CandidateEducation": "matching",
+    # roadmap
+    "RoadmapRequest": "roadmap",
+    "RoadmapResponse": "roadmap",
+    "LearningPhase": "roadmap",
+    "SkillNode": "roadmap",
+    "LearningResource": "roadmap",
+    # auth
+    "Token": "auth",
+    "TokenData": "auth",
+    "UserCreate": "auth",
+    "UserUpdate": "auth",
+    "ChangePassword": "auth",
+    "UserOut": "auth",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,6 +6,7 @@ class Token(BaseModel):
     token_type: str
 
 class TokenData(BaseModel):
+    user_id: Optional[int] = None
     email: Optional[str] = None
 
 class UserBase(BaseModel):
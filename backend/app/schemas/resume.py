@@ -1,6 +1,6 @@
 """Resume-related schemas"""
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class ExtractedField(BaseModel):
@@ -30,6 +30,11 @@ class ProjectEntry(BaseModel):
     description: List[str] = []
     confidence: int = 0
 
+# Built once: dump a whole list through pydantic-core instead of one model_dump per entry
+EDUCATION_LIST_ADAPTER = TypeAdapter(List[EducationEntry])
+WORK_EXPERIENCE_LIST_ADAPTER = TypeAdapter(List[WorkExperienceEntry])
+PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectEntry])
+
 class ParsedResume(BaseModel):
     """Complete parsed resume with all fields"""
     id: Optional[int] = None
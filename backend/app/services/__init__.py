@@ -1,4 +1,23 @@
 """Services layer - Business logic for Wevolve API"""
+from functools import lru_cache
+
 from .resume_service import ResumeParser
-from .matching_service import MatchingEngine
+from .matching_service import MatchingEngine, JobCorpus
 from .roadmap_service import RoadmapGenerator
+
+
+# Per-process service singletons, built on first use rather than at router import.
+# Routers take them as FastAPI dependencies (Depends(get_parser)) so tests can override them.
+@lru_cache(maxsize=1)
+def get_parser() -> ResumeParser:
+    return ResumeParser()
+
+
+@lru_cache(maxsize=1)
+def get_matching_engine() -> MatchingEngine:
+    return MatchingEngine()
+
+
+@lru_cache(maxsize=1)
+def get_roadmap_generator() -> RoadmapGenerator:
+    return RoadmapGenerator()
@@ -0,0 +1,38 @@
+"""
+Job Catalogue
+Parsed contents of data/jobs.json, cached per process and re-read only when
+the file changes on disk.
+"""
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import orjson
+
+JOBS_FILE = Path(__file__).parent.parent.parent / "data" / "jobs.json"
+
+_cache = {"mtime": None, "jobs": [], "by_id": {}}
+_lock = threading.Lock()
+
+
+def load_jobs() -> List[dict]:
+    """
+    Return the job list from jobs.json.
+    One stat() per call; the file is parsed again only when its mtime changes.
+    Raises FileNotFoundError if the file is missing.
+    """
+    mtime = JOBS_FILE.stat().st_mtime_ns
+    if mtime != _cache["mtime"]:
+        with _lock:
+            if mtime != _cache["mtime"]:
+                jobs = orjson.loads(JOBS_FILE.read_bytes()).get("jobs", [])
+                _cache["by_id"] = {job["id"]: job for job in jobs}
+                _cache["jobs"] = jobs
+                _cache["mtime"] = mtime
+    return _cache["jobs"]
+
+
+def load_jobs_by_id() -> Dict[int, dict]:
+    """Same as load_jobs, keyed by job id. Raises FileNotFoundError if the file is missing."""
+    load_jobs()
+    return _cache["by_id"]
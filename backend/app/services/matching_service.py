@@ -2,10 +2,61 @@
 Matching Engine Service
 Handles job-candidate matching with fuzzy string comparison and explainable scores
 """
-from typing import List, Tuple, Optional
-from thefuzz import process, fuzz
+from functools import partial
+from typing import List, Tuple, Optional, Dict
+import numpy as np
+from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+from thefuzz import utils as fuzz_utils
 
 from ..config import settings
+from .scoring_kernel import score_all
+
+
+class JobCorpus:
+    """
+    Structure-of-arrays view of the job catalogue.
+    Built once from the job rows so a match request can score every job with
+    a few NumPy expressions instead of a Python loop per job.
+    """
+
+    def __init__(self, jobs: List[dict]):
+        self.jobs = jobs
+        self.size = len(jobs)
+
+        # Dictionary-encode skills: one column per distinct skill name
+        self.skill_vocab: Dict[str, int] = {}
+        for job in jobs:
+            for skill in (job.get('required_skills') or []) + (job.get('nice_to_have_skills') or []):
+                self.skill_vocab.setdefault(skill, len(self.skill_vocab))
+        self.skill_names = list(self.skill_vocab)
+
+        self.required = np.zeros((self.size, len(self.skill_vocab)), dtype=bool)
+        self.optional = np.zeros((self.size, len(self.skill_vocab)), dtype=bool)
+        for row, job in enumerate(jobs):
+            for skill in job.get('required_skills') or []:
+                self.required[row, self.skill_vocab[skill]] = True
+            for skill in job.get('nice_to_have_skills') or []:
+                self.optional[row, self.skill_vocab[skill]] = True
+
+        # Numeric columns
+        self.salary_min = np.array([job.get('salary_min') or 0 for job in jobs], dtype=np.float64)
+        self.salary_max = np.array([job.get('salary_max') or 0 for job in jobs], dtype=np.float64)
+        self.min_experience = np.array([job.get('min_experience_years') or 0 for job in jobs], dtype=np.float64)
+
+        # Dictionary-encode locations and titles so string scoring runs once per distinct value
+        self.location_names, self.location_ids = self._encode([job.get('location') or '' for job in jobs])
+        self.title_names, self.title_ids = self._encode([job.get('title') or '' for job in jobs])
+
+    @staticmethod
+    def _encode(values: List[str]) -> Tuple[List[str], np.ndarray]:
+        """
+        Map each value to an integer id. Returns (distinct values, id per row).
+        Ids are int16 while the distinct count allows it, halving the gather's memory traffic.
+        """
+        index: Dict[str, int] = {}
+        ids = [index.setdefault(v, len(index)) for v in values]
+        dtype = np.int16 if len(index) <= np.iinfo(np.int16).max else np.int32
+        return list(index), np.array(ids, dtype=dtype)
 
 
 class MatchingEngine:
@@ -23,17 +74,17 @@ class MatchingEngine:
         {'mumbai', 'navi mumbai', 'thane', 'pune'},
         {'bangalore', 'bengaluru', 'mysore'},
     ]
+    # City -> index of its NEARBY_GROUPS entry (groups are disjoint)
+    CITY_TO_GROUP = {city: group_id for group_id, group in enumerate(NEARBY_GROUPS) for city in group}
     
     def __init__(self):
         # We use a threshold of 85 for fuzzy matches as established in job_matching.py
         self.MATCH_THRESHOLD = 85
-        self.weights = {
-            "skill": 0.4,
-            "location": 0.2,
-            "salary": 0.15,
-            "experience": 0.15,
-            "role": 0.1
-        }
+        # settings.MATCHING_WEIGHTS is the single source; the vector and tuple are views of it
+        self.weights = dict(settings.MATCHING_WEIGHTS)
+        self.weight_vector = settings.WEIGHTS_VEC
+        # Same weights as a tuple in breakdown order, unpacked into locals by calculate_total_score
+        self.weight_tuple = tuple(self.weight_vector.tolist())
     
     def calculate_skills_score(
         self, candidate_skills: List[str], required_skills: List[str],
@@ -46,23 +97,14 @@ class MatchingEngine:
         if not required_skills and not optional_skills:
             return 100.0, [], [], []
 
-        matched_req = []
-        missing_req = []
-        for req in required_skills:
-            match = process.extractOne(req, candidate_skills, scorer=fuzz.token_set_ratio)
-            if match and match[1] >= self.MATCH_THRESHOLD:
-                matched_req.append(req)
-            else:
-                missing_req.append(req)
-        
-        matched_opt = []
-        missing_opt = []
-        for opt in optional_skills:
-            match = process.extractOne(opt, candidate_skills, scorer=fuzz.token_set_ratio)
-            if match and match[1] >= self.MATCH_THRESHOLD:
-                matched_opt.append(opt)
-            else:
-                missing_opt.append(opt)
+        # One fuzzy matrix over required + optional skills; split the hit mask back afterwards
+        hits = self.match_skill_vocabulary(candidate_skills, required_skills + optional_skills).tolist()
+        req_hits = hits[:len(required_skills)]
+        opt_hits = hits[len(required_skills):]
+        matched_req = [s for s, hit in zip(required_skills, req_hits) if hit]
+        missing_req = [s for s, hit in zip(required_skills, req_hits) if not hit]
+        matched_opt = [s for s, hit in zip(optional_skills, opt_hits) if hit]
+        missing_opt = [s for s, hit in zip(optional_skills, opt_hits) if not hit]
         
         # Calculate scores
         # If no required skills, req_score is 100
@@ -75,10 +117,20 @@ class MatchingEngine:
         
         return skill_score, matched_req + matched_opt, missing_req, missing_opt
 
+    def normalize_city(self, name: str) -> str:
+        """Lowercase a city name and resolve old/alternate names via CITY_ALIASES"""
+        lowered = name.lower()
+        return self.CITY_ALIASES.get(lowered, lowered)
+
     def calculate_location_score(
-        self, candidate_locations: List[str], job_location: str
+        self, candidate_locations: List[str], job_location: str,
+        normalized_locations: Optional[List[str]] = None
     ) -> float:
-        """Calculate location match score. candidate_locations is a list (from schema)"""
+        """
+        Calculate location match score. candidate_locations is a list (from schema).
+        normalized_locations may carry normalize_city() of each candidate location,
+        precomputed once when the same candidate is scored against many jobs.
+        """
         if not candidate_locations or not job_location:
             return 0.0
             
@@ -86,16 +138,17 @@ class MatchingEngine:
             return 100.0
             
         # Check aliases and groups
-        normalized_job = self.CITY_ALIASES.get(job_location.lower(), job_location.lower())
+        normalized_job = self.normalize_city(job_location)
+        if normalized_locations is None:
+            normalized_locations = [self.normalize_city(loc) for loc in candidate_locations]
         
-        for loc in candidate_locations:
-            normalized_loc = self.CITY_ALIASES.get(loc.lower(), loc.lower())
+        for normalized_loc in normalized_locations:
             if normalized_loc == normalized_job:
                 return 100.0
                 
-            for group in self.NEARBY_GROUPS:
-                if normalized_loc in group and normalized_job in group:
-                    return 80.0
+            group_id = self.CITY_TO_GROUP.get(normalized_loc)
+            if group_id is not None and group_id == self.CITY_TO_GROUP.get(normalized_job):
+                return 80.0
         
         return 0.0
 
@@ -124,46 +177,151 @@ class MatchingEngine:
         if not preferred_roles or not job_title:
             return 70.0 # Neutral score
             
-        role_match_result = process.extractOne(job_title, preferred_roles, scorer=fuzz.token_set_ratio)
-        return role_match_result[1] if role_match_result else 0.0
+        # Same score as thefuzz extractOne, computed in one rapidfuzz call
+        return float(self.best_fuzzy_scores([job_title], preferred_roles)[0])
 
     def calculate_total_score(self, breakdown: dict) -> float:
-        """Calculate weighted total score based on the established 0.4, 0.2, 0.15, 0.15, 0.1 weights"""
+        """Calculate weighted total score using settings.MATCHING_WEIGHTS"""
+        w_skill, w_location, w_salary, w_experience, w_role = self.weight_tuple
         total = (
-            breakdown['skill_match'] * self.weights['skill'] +
-            breakdown['location_match'] * self.weights['location'] +
-            breakdown['salary_match'] * self.weights['salary'] +
-            breakdown['experience_match'] * self.weights['experience'] +
-            breakdown['role_match'] * self.weights['role']
+            breakdown['skill_match'] * w_skill +
+            breakdown['location_match'] * w_location +
+            breakdown['salary_match'] * w_salary +
+            breakdown['experience_match'] * w_experience +
+            breakdown['role_match'] * w_role
         )
         return round(total, 1)
 
     @staticmethod
-    def get_match_tier(score: float) -> str:
+    def best_fuzzy_scores(queries: List[str], choices: List[str]) -> np.ndarray:
+        """
+        Best token_set_ratio of each query against the choices, computed as one
+        rapidfuzz cdist matrix over the queries without an exact (normalized)
+        hit. Same values as thefuzz process.extractOne
+        (same preprocessing, rounded to int); 0 when there are no choices.
+        """
+        best = np.zeros(len(queries), dtype=np.float64)
+        if not queries or not choices:
+            return best
+        processor = partial(fuzz_utils.full_process, force_ascii=True)
+        processed_queries = [processor(fuzz_utils.full_process(q)) for q in queries]
+        processed_choices = [processor(c) for c in choices]
+
+        # Exact hits after normalization always score 100; only the rest need fuzzy scoring
+        exact = frozenset(c for c in processed_choices if c)
+        hit = np.fromiter((q in exact for q in processed_queries), dtype=bool, count=len(queries))
+        best[hit] = 100.0
+        rest = np.flatnonzero(~hit)
+        if rest.size:
+            scores = rf_process.cdist(
+                [processed_queries[i] for i in rest], processed_choices,
+                scorer=rf_fuzz.token_set_ratio, dtype=np.float64
+            )
+            best[rest] = np.round(scores.max(axis=1))
+        return best
+
+    def match_skill_vocabulary(self, candidate_skills: List[str], vocabulary: List[str]) -> np.ndarray:
+        """Fuzzy-match every vocabulary skill against the candidate once. Returns a bool mask"""
+        return self.best_fuzzy_scores(vocabulary, candidate_skills) >= self.MATCH_THRESHOLD
+
+    def score_corpus(
+        self, candidate: dict, corpus: JobCorpus
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score a candidate against every job in the corpus at once.
+        Returns (component scores [N, 5], weighted totals [N], candidate skill mask [V]).
+        Components are ordered skill, location, salary, experience, role.
+        """
+        skill_mask = self.match_skill_vocabulary(candidate.get('skills') or [], corpus.skill_names)
+
+        # Location and role are string comparisons: score each distinct value once, then gather
+        preferred = candidate.get('preferred_locations') or []
+        normalized_preferred = [self.normalize_city(loc) for loc in preferred]
+        location_table = np.array(
+            [self.calculate_location_score(preferred, loc, normalized_preferred) for loc in corpus.location_names],
+            dtype=np.float64
+        )
+        roles = candidate.get('preferred_roles') or []
+        role_table = self.best_fuzzy_scores(corpus.title_names, roles)
+        # Neutral 70 when there is no preference or no title, as in calculate_role_score
+        role_table[[not roles or not title for title in corpus.title_names]] = 70.0
+
+        components, totals = score_all(
+            skill_mask, corpus.required, corpus.optional,
+            corpus.salary_min, corpus.salary_max, corpus.min_experience,
+            float(self._expected_salary(candidate)), float(candidate.get('experience_years') or 0),
+            location_table[corpus.location_ids], role_table[corpus.title_ids], self.weight_vector
+        )
+        return components, totals, skill_mask
+
+    @staticmethod
+    def _expected_salary(candidate: dict) -> float:
+        """Expected salary may arrive as a number or a {'min': ...} dict"""
+        expected = candidate.get('expected_salary')
+        if isinstance(expected, dict):
+            return expected.get('min', 0) or 0
+        if isinstance(expected, (int, float)):
+            return expected
+        return 0
+
+    # Tier lower bounds (fair, good, excellent) and labels indexed by np.searchsorted position
+    TIER_EDGES = np.array([
+        settings.MATCH_TIERS.get('fair', 50),
+        settings.MATCH_TIERS.get('good', 70),
+        settings.MATCH_TIERS.get('excellent', 85)
+    ], dtype=np.float64)
+    TIER_LABELS = np.array(["Poor Match", "Fair Match", "Good Match ✓", "Excellent Match ⭐"])
+    # The same cutoffs as plain numbers (excellent, good, fair) for the scalar get_match_tier
+    TIER_CUTOFFS = (
+        settings.MATCH_TIERS.get('excellent', 85),
+        settings.MATCH_TIERS.get('good', 70),
+        settings.MATCH_TIERS.get('fair', 50)
+    )
+
+    def rank_jobs(
+        self, totals: np.ndarray, min_tier: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Round every total the way calculate_total_score does and rank on those scores.
+        Returns (job indices best first, stable for ties; rounded score per job).
+        With min_tier ('fair', 'good', 'excellent'), jobs scoring below that tier's
+        cutoff are dropped before anything is built for them.
+        """
+        scores = np.array([round(t, 1) for t in totals.tolist()], dtype=np.float64)
+        order = np.argsort(-scores, kind="stable")
+        if min_tier is not None:
+            order = order[scores[order] >= settings.MATCH_TIERS[min_tier]]
+        return order, scores
+
+    def get_match_tiers(self, scores) -> List[str]:
+        """Vectorized get_match_tier: bucket every score with one searchsorted call"""
+        return self.TIER_LABELS[np.searchsorted(self.TIER_EDGES, scores, side="right")].tolist()
+
+    @classmethod
+    def get_match_tier(cls, score: float) -> str:
         """Convert score to tier label"""
-        if score >= settings.MATCH_TIERS.get('excellent', 85):
+        excellent, good, fair = cls.TIER_CUTOFFS
+        if score >= excellent:
             return "Excellent Match ⭐"
-        elif score >= settings.MATCH_TIERS.get('good', 70):
+        elif score >= good:
             return "Good Match ✓"
-        elif score >= settings.MATCH_TIERS.get('fair', 50):
+        elif score >= fair:
             return "Fair Match"
         return "Poor Match"
 
+    # Breakdown keys and their display names, in the order ties are resolved
+    EXPLANATION_FACTORS = ('skill_match', 'location_match', 'salary_match', 'experience_match', 'role_match')
+    EXPLANATION_NAMES = ('Skills', 'Location', 'Salary', 'Experience', 'Role')
+
     def generate_explanation(self, result: dict) -> Tuple[str, str, str]:
         """Generate human-readable explanation, top strength, and improvement area"""
         # This mirrors the logic in the router but works on the returned dict
         breakdown = result['breakdown']
-        scores = {
-            'Skills': breakdown['skill_match'],
-            'Location': breakdown['location_match'],
-            'Salary': breakdown['salary_match'],
-            'Experience': breakdown['experience_match'],
-            'Role': breakdown['role_match']
-        }
-        
-        best = max(scores, key=scores.get)
-        worst = min(scores, key=scores.get)
-        
+        vals = tuple(breakdown[key] for key in self.EXPLANATION_FACTORS)
+        best_i = max(range(5), key=vals.__getitem__)
+        worst_i = min(range(5), key=vals.__getitem__)
+        best, worst = self.EXPLANATION_NAMES[best_i], self.EXPLANATION_NAMES[worst_i]
+
         parts = []
         if breakdown['skill_match'] >= 80:
             parts.append("Strong skills alignment")
@@ -178,10 +336,10 @@ class MatchingEngine:
             parts.append("Salary expectations align well")
         
         explanation = ". ".join(parts) + "." if parts else "Match score calculated based on profile data."
-        top_reason = f"{best} ({int(scores[best])}%)"
+        top_reason = f"{best} ({int(vals[best_i])}%)"
         
-        if scores[worst] < 70:
-            improve = f"Improve your {worst.lower()} match (currently {int(scores[worst])}%)"
+        if vals[worst_i] < 70:
+            improve = f"Improve your {worst.lower()} match (currently {int(vals[worst_i])}%)"
         else:
             improve = "All factors are well-matched!"
             
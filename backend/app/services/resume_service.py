@@ -12,7 +12,11 @@ Implements the complete "Master Rule List" for robust resume parsing:
 """
 import re
 import io
-from typing import List, Dict, Any, Optional, Tuple
+import os
+from calendar import monthrange
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union, BinaryIO
 from datetime import datetime
 from dateutil import parser as date_parser
 from dateutil.relativedelta import relativedelta
@@ -20,6 +24,83 @@ from dateutil.relativedelta import relativedelta
 from ..schemas.resume import ExtractedField
 
 
+def _keyword_trie(keywords, word_end: bool) -> str:
+    """
+    Regex source matching any of the keywords, shaped as a trie so keywords
+    sharing a prefix share one branch. At each position the longest keyword is
+    tried first; with word_end, a keyword only ends at a word boundary.
+    """
+    trie: Dict[str, dict] = {}
+    for word in keywords:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # end of a keyword
+
+    def branch(node: dict) -> str:
+        # Longer continuations are tried before ending the keyword here
+        alternatives = [re.escape(ch) + branch(child) for ch, child in sorted(node.items()) if ch]
+        if '' in node:
+            alternatives.append(r'\b' if word_end else '')
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+
+    return branch(trie)
+
+
+def _build_keyword_scanner(keywords) -> Tuple[re.Pattern, Dict[str, List[str]]]:
+    """
+    Compile lowercase keywords into one trie-shaped regex that finds every
+    whole-word occurrence in a single pass over the text.
+    Returns (pattern, implied): pattern.finditer yields the longest keyword
+    starting at each position in group 1; implied maps a keyword to the shorter
+    keywords that also match at that position (e.g. "spring boot" -> ["spring"]).
+    """
+    # Zero-width lookahead so overlapping keywords at later positions are still seen
+    pattern = re.compile(r'(?=\b(' + _keyword_trie(keywords, word_end=True) + '))')
+    implied = {
+        longer: [
+            shorter for shorter in keywords
+            if shorter != longer and re.match(r'\b' + re.escape(shorter) + r'\b', longer)
+        ]
+        for longer in keywords
+    }
+    return pattern, implied
+
+
+# One end of a resume date range: "Jan 2020" / "January, 2020", "01/2020" or "2020".
+# Month abbreviations are grouped by shared prefix so each alternative is tried once.
+_DATE_TOKEN_PATTERN = (
+    r'(?:J(?:an|u[nl])|Feb|Ma[ry]|A(?:pr|ug)|Sep|Oct|Nov|Dec)[a-z]*[\s,]*\d{4}'
+    r'|\d{1,2}/\d{4}|\d{4}'
+)
+
+# Month/year layouts that cover nearly every resume date; anything else goes to dateutil
+_FAST_DATE_FORMATS = (
+    ("%b %Y", True), ("%B %Y", True), ("%b, %Y", True), ("%B, %Y", True),
+    ("%m/%Y", True), ("%Y", False),
+)
+
+
+@lru_cache(maxsize=1024)
+def _fast_month_year(date_str: str) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    (year, month) for a date in one of _FAST_DATE_FORMATS; month is None when
+    only the year is given. None if no format matches.
+    """
+    normalized = ' '.join(date_str.split())
+    for fmt, has_month in _FAST_DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(normalized, fmt)
+        except ValueError:
+            continue
+        if parsed.year < 100:
+            return None  # dateutil reads two-digit years ("0099") as 1999/2099
+        return parsed.year, parsed.month if has_month else None
+    return None
+
+
 class ResumeParser:
     """
     Advanced Resume Parser with Master Rule Implementation
@@ -39,60 +120,106 @@ class ResumeParser:
         'certifications': ['certifications', 'certificates', 'courses', 'training'],
         'achievements': ['achievements', 'awards', 'honors', 'accomplishments']
     }
+    # One literal alternation per section, longest keyword first, checked in SECTION_KEYWORDS
+    # order so the first section with any keyword in the line still wins
+    SECTION_REGEXES = tuple(
+        (name, re.compile('|'.join(map(re.escape, sorted(keywords, key=len, reverse=True)))))
+        for name, keywords in SECTION_KEYWORDS.items()
+    )
     
     # ============================================================
     # REGEX PATTERNS (Rule 2)
     # ============================================================
-    EMAIL_REGEX = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    # Patterns whose classes are ASCII by nature are compiled with re.ASCII so SRE uses
+    # its ASCII tables. Patterns with \s are left Unicode-aware: PDF text often separates
+    # tokens with U+00A0 and other Unicode spaces
+    EMAIL_REGEX = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.ASCII)
     
-    # Comprehensive phone regex (supports international formats)
-    PHONE_REGEX = re.compile(
-        r'(?:(?:\+|00)([1-9]\d{0,2})[\s.\-]?)?'  # Country code
-        r'(?:\(?\d{2,5}\)?[\s.\-]?)?'             # Area code
-        r'\d{3,5}[\s.\-]?\d{3,5}'                 # Main number
+    # Indian mobile formats, tried in priority order
+    PHONE_SIMPLE_REGEXES = (
+        re.compile(r'\+91[\s\-]?[6-9]\d{9}'),
+        re.compile(r'[6-9]\d{9}'),
+        re.compile(r'\d{5}[\s\-]?\d{5}'),
     )
+    # The simple patterns only match digits, '+', '-' and whitespace (\s), so deleting
+    # those separators with str.translate leaves exactly the digits
+    PHONE_SEPARATORS = str.maketrans('', '', '+-' + ''.join(
+        ch for ch in map(chr, range(0x3001)) if ch.isspace()  # every str.isspace() char is below U+3001
+    ))
     
     # Date range patterns for experience calculation
     DATE_RANGE_REGEX = re.compile(
-        r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]*\d{4}|'
-        r'\d{1,2}/\d{4}|\d{4})'
+        r'(' + _DATE_TOKEN_PATTERN + r')'
         r'\s*[-–—to]+\s*'
-        r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]*\d{4}|'
-        r'\d{1,2}/\d{4}|\d{4}|Present|Current|Till Date|Ongoing)',
+        r'(' + _DATE_TOKEN_PATTERN + r'|Present|Current|Till Date|Ongoing)',
         re.IGNORECASE
     )
     
+    # Explicit "X years experience" statements, tried in priority order on lowercased text
+    EXPLICIT_YEARS_REGEXES = (
+        re.compile(r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s*experience'),
+        re.compile(r'experience[:\s]+(\d+)\+?\s*(?:years?|yrs?)'),
+        re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s+in\s+(?:software|development|tech|IT)'),
+    )
+    
+    # Fallback date formats when dateutil cannot parse
+    MONTH_YEAR_REGEX = re.compile(r'(\d{1,2})/(\d{4})')
+    YEAR_ONLY_REGEX = re.compile(r'(\d{4})')
+    
     # Pincode regex (Indian 6-digit, not starting with 0)
-    PINCODE_REGEX = re.compile(r'\b[1-9]\d{5}\b')
+    PINCODE_REGEX = re.compile(r'\b[1-9]\d{5}\b', re.ASCII)
     
     # CGPA/GPA extraction
     CGPA_REGEX = re.compile(r'(?:CGPA|GPA|Grade)[:\s]*(\d+\.?\d*)\s*(?:/\s*10)?', re.IGNORECASE)
     PERCENTAGE_REGEX = re.compile(r'(\d{2,3}(?:\.\d+)?)\s*%')
+    EDUCATION_YEAR_REGEX = re.compile(r'20\d{2}(?:\s*[-–]\s*20\d{2})?')
+    
+    # Field of study: "in Computer Science", "- Electronics", or a bare known field
+    FIELD_OF_STUDY_REGEXES = (
+        re.compile(r'in\s+([A-Za-z\s]+?)(?:\s*,|\s*\(|$)', re.IGNORECASE),
+        re.compile(r'-\s*([A-Za-z\s]+?)(?:\s*,|\s*\(|$)', re.IGNORECASE),
+        re.compile(r'(?:Computer Science|Electronics|Mechanical|Civil|Chemical|IT|Information Technology)', re.IGNORECASE),
+    )
+    
+    # Title/company separators, tried in order: |, dashes, at, for, comma
+    TITLE_COMPANY_SEPARATORS = tuple(re.compile(sep, re.IGNORECASE) for sep in (
+        r'\s+\|\s+',           # " | "
+        r'\s+-\s+',            # " - " (but careful with hyphens in names)
+        r'\s+–\s+',            # En dash
+        r'\s+—\s+',            # Em dash
+        r'\s+at\s+',           # " at "
+        r'\s+for\s+',          # " for "
+        r',\s+'                # ", " with space
+    ))
     
     # ============================================================
     # TRUSTED DOMAINS for Email Validation (Rule 2)
     # ============================================================
-    TRUSTED_DOMAINS = {
+    TRUSTED_DOMAINS = frozenset({
         'gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com',
         'icloud.com', 'protonmail.com', 'mail.com',
         # Indian educational domains
         'edu.in', 'ac.in', 'iitb.ac.in', 'iitd.ac.in', 'iitk.ac.in',
         'iitkgp.ac.in', 'bits-pilani.ac.in', 'nitrkl.ac.in'
-    }
+    })
     
     # ============================================================
     # NAME STOPWORDS (Rule 3)
     # ============================================================
-    NAME_STOPWORDS = {
+    NAME_STOPWORDS = frozenset({
         'resume', 'cv', 'curriculum vitae', 'mobile', 'email', 'address',
         'page', 'contact', 'phone', 'tel', 'linkedin', 'github', 'portfolio',
         'http', 'www', '@', 'objective', 'summary'
-    }
+    })
+    NAME_STOPWORD_REGEX = re.compile(_keyword_trie(NAME_STOPWORDS, word_end=False))
+    # Anything but ASCII letters, spaces and dots (initials) rules a line out as a name;
+    # this covers digits too
+    NAME_BAD_CHAR_REGEX = re.compile(r'[^A-Za-z .]')
     
     # ============================================================
     # DEGREE KEYWORDS for Education (Rule 4)
     # ============================================================
-    DEGREE_KEYWORDS = {
+    DEGREE_KEYWORDS = frozenset({
         'b.tech', 'btech', 'b tech', 'm.tech', 'mtech', 'm tech',
         'b.e', 'be', 'b e', 'm.e', 'me', 'm e',
         'b.sc', 'bsc', 'b sc', 'm.sc', 'msc', 'm sc',
@@ -100,32 +227,45 @@ class ResumeParser:
         'phd', 'ph.d', 'doctorate', 'bachelor', 'master', 'diploma',
         'hsc', 'ssc', 'cbse', 'icse', '10th', '12th', 'intermediate',
         'b.a', 'ba', 'm.a', 'ma', 'b.ed', 'bed', 'm.ed', 'med'
-    }
+    })
+    # Longest first, so 'b.tech' wins over 'b.e' / 'be' when naming the degree
+    DEGREE_KEYWORDS_LONGEST_FIRST = tuple(sorted(DEGREE_KEYWORDS, key=len, reverse=True))
+    # Trie-shaped alternations: does a line contain any degree / institute keyword?
+    DEGREE_KEYWORD_REGEX = re.compile(_keyword_trie(DEGREE_KEYWORDS, word_end=False))
     
-    INSTITUTE_KEYWORDS = {
+    INSTITUTE_KEYWORDS = frozenset({
         'university', 'institute', 'college', 'school', 'academy',
         'iit', 'nit', 'iiit', 'bits', 'vit', 'srm', 'manipal',
         'engineering', 'technology', 'polytechnic', 'vidyalaya'
-    }
+    })
+    INSTITUTE_KEYWORD_REGEX = re.compile(_keyword_trie(INSTITUTE_KEYWORDS, word_end=False))
     
     # ============================================================
     # JOB TITLE KEYWORDS for Experience (Rule 5)
     # ============================================================
-    JOB_TITLE_KEYWORDS = {
+    JOB_TITLE_KEYWORDS = frozenset({
         'intern', 'internship', 'trainee', 'associate', 'assistant',
         'developer', 'engineer', 'analyst', 'designer', 'architect',
         'manager', 'lead', 'senior', 'junior', 'principal', 'staff',
         'consultant', 'specialist', 'administrator', 'coordinator',
         'executive', 'officer', 'head', 'director', 'vp', 'cto', 'ceo'
-    }
+    })
+    # Any title keyword as a whole word ("architect" but not "architecture"), longest first
+    JOB_TITLE_REGEX = re.compile(
+        r'\b(?:' + '|'.join(re.escape(k) for k in sorted(JOB_TITLE_KEYWORDS, key=lambda k: (-len(k), k))) + r')\b'
+    )
     
     # ============================================================
     # SKILLS TAXONOMY (Rule 6)
     # ============================================================
     # Short/ambiguous skills that need context
-    AMBIGUOUS_SKILLS = {'c', 'r', 'go', 'vue', 'dart', 'rust', 'swift', 'perl'}
+    AMBIGUOUS_SKILLS = frozenset({'c', 'r', 'go', 'vue', 'dart', 'rust', 'swift', 'perl'})
+    # Ambiguous skills only count when comma-separated (start/comma before, comma/end after)
+    AMBIGUOUS_SKILL_REGEXES = {
+        skill: re.compile(rf'(?:^|,\s*){re.escape(skill)}(?:\s*,|\s*$)') for skill in AMBIGUOUS_SKILLS
+    }
     
-    KNOWN_SKILLS = {
+    KNOWN_SKILLS = frozenset({
         # Programming Languages
         "python", "javascript", "typescript", "java", "c++", "c#", "go", "rust",
         "ruby", "php", "swift", "kotlin", "scala", "perl", "r", "matlab", "dart",
@@ -162,28 +302,47 @@ class ResumeParser:
         "microservices", "agile", "scrum", "kanban", "ci/cd", "devops",
         "testing", "jest", "pytest", "selenium", "cypress", "postman",
         "figma", "sketch", "adobe xd", "photoshop", "illustrator"
+    })
+    
+    # Lowercase skill -> display name (title case, or upper case for names of 3 chars or fewer),
+    # in KNOWN_SKILLS iteration order
+    KNOWN_SKILL_DISPLAY = {
+        skill.lower(): skill.title() if len(skill) > 3 else skill.upper() for skill in KNOWN_SKILLS
     }
     
+    # Single-pass whole-word scanner over the non-ambiguous skills
+    SKILL_SCANNER, SKILL_SCANNER_IMPLIED = _build_keyword_scanner(
+        sorted({skill.lower() for skill in KNOWN_SKILLS} - AMBIGUOUS_SKILLS)
+    )
+    
     # ============================================================
     # INDIAN CITIES & STATES (Rule 7)
     # ============================================================
-    INDIAN_CITIES = {
+    INDIAN_CITIES = frozenset({
         'bangalore', 'bengaluru', 'mumbai', 'delhi', 'new delhi', 'hyderabad',
         'chennai', 'pune', 'kolkata', 'ahmedabad', 'jaipur', 'noida', 'gurgaon',
         'gurugram', 'ghaziabad', 'faridabad', 'lucknow', 'kanpur', 'nagpur',
         'indore', 'bhopal', 'patna', 'vadodara', 'surat', 'kochi', 'thiruvananthapuram',
         'coimbatore', 'visakhapatnam', 'chandigarh', 'mysore', 'mangalore',
         'rourkela', 'bhubaneswar', 'cuttack'
-    }
+    })
     
-    INDIAN_STATES = {
+    INDIAN_STATES = frozenset({
         'andhra pradesh', 'arunachal pradesh', 'assam', 'bihar', 'chhattisgarh',
         'goa', 'gujarat', 'haryana', 'himachal pradesh', 'jharkhand', 'karnataka',
         'kerala', 'madhya pradesh', 'maharashtra', 'manipur', 'meghalaya', 'mizoram',
         'nagaland', 'odisha', 'punjab', 'rajasthan', 'sikkim', 'tamil nadu',
         'telangana', 'tripura', 'uttar pradesh', 'uttarakhand', 'west bengal',
         'delhi', 'jammu and kashmir', 'ladakh'
-    }
+    })
+    
+    # One alternation each, longest names first; search() returns the earliest mention
+    INDIAN_CITY_REGEX = re.compile(
+        '|'.join(re.escape(city) for city in sorted(INDIAN_CITIES, key=lambda c: (-len(c), c)))
+    )
+    INDIAN_STATE_REGEX = re.compile(
+        '|'.join(re.escape(state) for state in sorted(INDIAN_STATES, key=lambda s: (-len(s), s)))
+    )
     
     # Pincode to City mapping (sample - can be extended)
     PINCODE_CITY_MAP = {
@@ -198,33 +357,59 @@ class ResumeParser:
     # ============================================================
     
     # Rule B: Action Verbs that indicate DESCRIPTION (not title)
-    ACTION_VERBS = {
+    ACTION_VERBS = frozenset({
         'developed', 'created', 'built', 'implemented', 'designed', 'fixed',
         'established', 'launched', 'deployed', 'integrated', 'optimized',
         'maintained', 'managed', 'led', 'coordinated', 'improved', 'enhanced',
         'refactored', 'migrated', 'configured', 'automated', 'analyzed',
         'tested', 'debugged', 'resolved', 'achieved', 'reduced', 'increased',
         'streamlined', 'collaborated', 'contributed', 'utilized', 'leveraged'
-    }
+    })
     
     # Rule C: Noun Signals that indicate PROJECT TITLE
-    PROJECT_NOUN_SIGNALS = {
+    PROJECT_NOUN_SIGNALS = frozenset({
         'system', 'app', 'application', 'clone', 'portal', 'dashboard',
         'engine', 'api', 'model', 'detector', 'bot', 'platform', 'website',
         'tool', 'framework', 'library', 'service', 'manager', 'analyzer',
         'generator', 'tracker', 'monitor', 'classifier', 'predictor',
         'scraper', 'crawler', 'simulator', 'calculator', 'converter',
         'chatbot', 'assistant', 'interface', 'pipeline', 'network'
-    }
+    })
+    # Does the text contain any project noun (as a substring)?
+    PROJECT_NOUN_REGEX = re.compile(_keyword_trie(PROJECT_NOUN_SIGNALS, word_end=False))
     
     # Tech Stack Keywords (Rule A for tech detection)
-    TECH_STACK_LABELS = {
+    TECH_STACK_LABELS = frozenset({
         'tech stack:', 'technology:', 'technologies:', 'key skills:',
         'environment:', 'tools:', 'stack:', 'tech:'
-    }
+    })
+    # Leftmost label in a line; its match end is where the tech list starts
+    TECH_STACK_LABEL_REGEX = re.compile(_keyword_trie(TECH_STACK_LABELS, word_end=False))
+    
+    # Small words allowed to stay lowercase in a Title Case project name
+    TITLE_CASE_SMALL_WORDS = frozenset({'a', 'an', 'the', 'of', 'in', 'on', 'at', 'to', 'for', 'and', 'or', 'but'})
     
     # Rule C: Connectors that separate title from tech stack
-    TECH_STACK_CONNECTORS = {'using', 'built with', 'with', 'powered by', 'made with'}
+    TECH_STACK_CONNECTORS = frozenset({'using', 'built with', 'with', 'powered by', 'made with'})
+    # (search pattern for lowercased lines, case-insensitive split pattern) per connector
+    TECH_STACK_CONNECTOR_REGEXES = tuple(
+        (re.compile(rf'\s+{re.escape(connector)}\s+'), re.compile(rf'\s+{re.escape(connector)}\s+', re.IGNORECASE))
+        for connector in TECH_STACK_CONNECTORS
+    )
+    # Does the line contain any connector at all? Most lines don't, and one search rules them out
+    TECH_STACK_CONNECTOR_ANY_REGEX = re.compile(
+        r'\s+(?:' + '|'.join(re.escape(c) for c in sorted(TECH_STACK_CONNECTORS, key=len, reverse=True)) + r')\s+'
+    )
+    
+    # Tech stack parsing: "Name (React, Node)" titles and the separators inside tech lists
+    PAREN_TECH_REGEX = re.compile(r'([^(]+)\s*\(([^)]+)\)\s*$')
+    # Parenthetical and label lists split on single characters (',', '|', '/' and, for labels, '•'),
+    # which str.replace + str.split handle faster than a regex
+    CONNECTOR_TECH_SPLIT_REGEX = re.compile(r',\s*|\s+and\s+')
+    TECH_TOKEN_REGEX = re.compile(r'^[A-Za-z0-9.#+-]+$')
+    
+    # Leading bullet characters stripped from experience and project description lines
+    BULLET_CHARS = '-•*→▪▸ '
 
     # ============================================================
     # RULE 1: SECTIONIZER - Zone-based Text Splitting
@@ -234,45 +419,47 @@ class ResumeParser:
         Split resume into zones based on section headers.
         Returns a dict with section names as keys and their content as values.
         """
-        lines = text.split('\n')
-        sections = {'header': '', 'unknown': ''}
-        current_section = 'header'
+        # Lines are collected per section and joined once at the end; growing each
+        # section string with += would copy it again for every line
+        section_lines: Dict[str, List[str]] = {'header': [], 'unknown': []}
+        current_lines = section_lines['header']
         
-        for i, line in enumerate(lines):
+        for line in text.split('\n'):
             line_lower = line.lower().strip()
-            words = line_lower.split()
+            # Up to 5 words is enough to tell whether there are fewer than 5
+            words = line_lower.split(None, 4)
             
             # Check if this line is a section header (< 5 words + contains keyword)
-            if len(words) < 5 and line.strip():
+            if words and len(words) < 5:
                 detected_section = None
-                for section_name, keywords in self.SECTION_KEYWORDS.items():
-                    if any(kw in line_lower for kw in keywords):
+                for section_name, regex in self.SECTION_REGEXES:
+                    if regex.search(line_lower):
                         detected_section = section_name
                         break
                 
                 if detected_section:
-                    current_section = detected_section
-                    if current_section not in sections:
-                        sections[current_section] = ''
+                    current_lines = section_lines.setdefault(detected_section, [])
                     continue  # Don't add the header line itself
             
             # Add line to current section
-            if current_section in sections:
-                sections[current_section] += line + '\n'
-            else:
-                sections[current_section] = line + '\n'
+            current_lines.append(line)
         
-        return sections
+        # Every line keeps its trailing newline, as before
+        return {
+            name: '\n'.join(lines) + '\n' if lines else ''
+            for name, lines in section_lines.items()
+        }
 
     # ============================================================
     # RULE 2: EMAIL EXTRACTION with Domain Validation
     # ============================================================
     def extract_email(self, text: str) -> ExtractedField:
         """Extract email with domain-based confidence scoring."""
-        matches = self.EMAIL_REGEX.findall(text)
+        # Only the first address is used: stop scanning at it instead of collecting every match
+        match = self.EMAIL_REGEX.search(text)
         
-        if matches:
-            email = matches[0].lower()
+        if match:
+            email = match.group(0).lower()
             domain = email.split('@')[1] if '@' in email else ''
             
             # Check if domain is trusted
@@ -297,23 +484,15 @@ class ResumeParser:
     # ============================================================
     def extract_phone(self, text: str) -> ExtractedField:
         """Extract phone with length validation."""
-        matches = self.PHONE_REGEX.findall(text)
-        
-        # Also try simpler patterns for Indian numbers
-        simple_patterns = [
-            r'\+91[\s\-]?[6-9]\d{9}',
-            r'[6-9]\d{9}',
-            r'\d{5}[\s\-]?\d{5}'
-        ]
-        
-        all_matches = []
-        for pattern in simple_patterns:
-            found = re.findall(pattern, text)
-            all_matches.extend(found)
+        # Candidates from the simple Indian-number patterns, in pattern priority order.
+        # Generated lazily so scanning stops at the first number that passes validation.
+        all_matches = (
+            found.group(0) for pattern in self.PHONE_SIMPLE_REGEXES for found in pattern.finditer(text)
+        )
         
         for match in all_matches:
             # Strip non-digits for length check
-            digits_only = re.sub(r'\D', '', match)
+            digits_only = match.translate(self.PHONE_SEPARATORS)
             
             # Length validation: 10-15 digits
             if 10 <= len(digits_only) <= 15:
@@ -345,36 +524,32 @@ class ResumeParser:
         - Stopword Filter
         - Shape Filter (Title/Upper case, 2-4 words, no digits/special chars)
         """
-        lines = text.strip().split('\n')
+        # Only search first 20 lines (Top 20 Lines Rule); maxsplit keeps the
+        # split to the header instead of breaking the whole resume into lines.
+        # Only leading whitespace shifts that window, so lstrip (which returns
+        # the text itself when there is none) instead of copying it with strip()
+        lines = text.lstrip().split('\n', 20)
         
-        # Only search first 20 lines (Top 20 Lines Rule)
         for line in lines[:20]:
             clean_line = line.strip()
             if not clean_line:
                 continue
             
-            line_lower = clean_line.lower()
+            # Filters run cheapest-rejection first; every one must pass, so order doesn't change the result.
+            # Shape Filter: Zero Digits and Zero Special Characters (except spaces and dots for initials).
+            # This rejects contact lines (emails, phones, URLs) before anything is lowercased or split
+            if self.NAME_BAD_CHAR_REGEX.search(clean_line):
+                continue
             
             # Stopword Filter
-            if any(stop in line_lower for stop in self.NAME_STOPWORDS):
+            if self.NAME_STOPWORD_REGEX.search(clean_line.lower()):
                 continue
             
-            # Shape Filter
+            # Shape Filter: Must be 2-4 words
             words = clean_line.split()
-            
-            # Must be 2-4 words
             if not (2 <= len(words) <= 4):
                 continue
             
-            # Must contain Zero Digits
-            if any(char.isdigit() for char in clean_line):
-                continue
-            
-            # Must contain Zero Special Characters (except spaces and dots for initials)
-            special_chars = set(clean_line) - set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ .')
-            if special_chars:
-                continue
-            
             # Check for Title Case or UPPER CASE
             is_title_case = all(w[0].isupper() for w in words if w)
             is_upper_case = clean_line.isupper()
@@ -395,7 +570,7 @@ class ResumeParser:
     # ============================================================
     # RULE 4: EDUCATION EXTRACTION with Fuzzy Clustering
     # ============================================================
-    def extract_education(self, text: str) -> List[Dict[str, Any]]:
+    def extract_education(self, text: str, sections: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """
         Extract education using Proximity Rule:
         - Find Degree keyword lines
@@ -403,44 +578,49 @@ class ResumeParser:
         - Cluster if within 3 lines of each other
         - Extract CGPA from clustered lines
         """
-        sections = self.sectionize(text)
+        if sections is None:
+            sections = self.sectionize(text)
         edu_text = sections.get('education', text)  # Fallback to full text
         
         lines = edu_text.split('\n')
         education_entries = []
         
-        # Find all degree and institute line indices
-        degree_lines = []
-        institute_lines = []
+        # Find all degree and institute line indices. Lowercasing the whole zone once
+        # keeps the lines aligned: str.lower() never adds or removes a newline
+        lines_lower = edu_text.lower().split('\n')
+        degree_search = self.DEGREE_KEYWORD_REGEX.search
+        institute_search = self.INSTITUTE_KEYWORD_REGEX.search
+        degree_lines = [(i, lines[i].strip()) for i, low in enumerate(lines_lower) if degree_search(low)]
+        institute_lines = [(i, lines[i].strip()) for i, low in enumerate(lines_lower) if institute_search(low)]
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            
-            # Check for degree keywords
-            if any(deg in line_lower for deg in self.DEGREE_KEYWORDS):
-                degree_lines.append((i, line.strip()))
-            
-            # Check for institute keywords
-            if any(inst in line_lower for inst in self.INSTITUTE_KEYWORDS):
-                institute_lines.append((i, line.strip()))
-        
-        # Cluster degrees with nearest institutes (within 3 lines)
-        used_institutes = set()
+        # Cluster degrees with nearest institutes (within 3 lines). Both lists are in line
+        # order, so one sweep suffices: institutes more than 3 lines above a degree are out
+        # of reach for every later degree too, leaving a window of at most 7 lines to check.
+        institute_used = [False] * len(institute_lines)
+        window_start = 0
         
         for deg_idx, degree_line in degree_lines:
+            while window_start < len(institute_lines) and institute_lines[window_start][0] < deg_idx - 3:
+                window_start += 1
+            
             best_institute = None
-            best_distance = float('inf')
+            best_distance = 4  # Anything closer than 4 lines qualifies; ties keep the earlier line
+            best_k = window_start
             
-            for inst_idx, inst_line in institute_lines:
-                if inst_idx in used_institutes:
+            for k in range(window_start, len(institute_lines)):
+                inst_idx = institute_lines[k][0]
+                if inst_idx > deg_idx + 3:
+                    break
+                if institute_used[k]:
                     continue
                 distance = abs(deg_idx - inst_idx)
-                if distance <= 3 and distance < best_distance:
+                if distance < best_distance:
                     best_distance = distance
-                    best_institute = (inst_idx, inst_line)
+                    best_institute = institute_lines[k]
+                    best_k = k
             
             if best_institute:
-                used_institutes.add(best_institute[0])
+                institute_used[best_k] = True
                 
                 # Extract CGPA from nearby lines (within cluster)
                 cluster_start = min(deg_idx, best_institute[0])
@@ -458,7 +638,7 @@ class ResumeParser:
                         cgpa = float(pct_match.group(1))
                 
                 # Extract year
-                year_match = re.search(r'20\d{2}(?:\s*[-–]\s*20\d{2})?', cluster_text)
+                year_match = self.EDUCATION_YEAR_REGEX.search(cluster_text)
                 year = year_match.group(0) if year_match else None
                 
                 # Parse degree type
@@ -488,21 +668,15 @@ class ResumeParser:
     def _extract_degree_type(self, line: str) -> str:
         """Extract the degree type from a line."""
         line_lower = line.lower()
-        for deg in sorted(self.DEGREE_KEYWORDS, key=len, reverse=True):
+        for deg in self.DEGREE_KEYWORDS_LONGEST_FIRST:
             if deg in line_lower:
                 return deg.upper().replace('.', '')
         return 'Unknown'
     
     def _extract_field(self, line: str) -> str:
         """Extract field of study from a line."""
-        # Common patterns: "in Computer Science", "- Electronics"
-        patterns = [
-            r'in\s+([A-Za-z\s]+?)(?:\s*,|\s*\(|$)',
-            r'-\s*([A-Za-z\s]+?)(?:\s*,|\s*\(|$)',
-            r'(?:Computer Science|Electronics|Mechanical|Civil|Chemical|IT|Information Technology)'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in self.FIELD_OF_STUDY_REGEXES:
+            match = pattern.search(line)
             if match:
                 return match.group(1).strip() if match.lastindex else match.group(0).strip()
         return 'Not specified'
@@ -510,14 +684,15 @@ class ResumeParser:
     # ============================================================
     # RULE 5: EXPERIENCE EXTRACTION with Date Math
     # ============================================================
-    def extract_experience_years(self, text: str) -> ExtractedField:
+    def extract_experience_years(self, text: str, sections: Optional[Dict[str, str]] = None) -> ExtractedField:
         """
         Calculate total years of experience using Date Math:
         - Extract all date ranges
         - Calculate duration for each
         - Sum up total experience
         """
-        sections = self.sectionize(text)
+        if sections is None:
+            sections = self.sectionize(text)
         exp_text = sections.get('experience', text)
         
         # Find all date ranges
@@ -555,14 +730,9 @@ class ResumeParser:
             )
         
         # Fallback: Try explicit "X years experience" pattern
-        explicit_patterns = [
-            r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s*experience',
-            r'experience[:\s]+(\d+)\+?\s*(?:years?|yrs?)',
-            r'(\d+)\+?\s*(?:years?|yrs?)\s+in\s+(?:software|development|tech|IT)',
-        ]
-        
-        for pattern in explicit_patterns:
-            match = re.search(pattern, text.lower())
+        text_lower = text.lower()
+        for pattern in self.EXPLICIT_YEARS_REGEXES:
+            match = pattern.search(text_lower)
             if match:
                 return ExtractedField(
                     value=float(match.group(1)),
@@ -576,15 +746,23 @@ class ResumeParser:
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse various date formats."""
+        fields = _fast_month_year(date_str)
+        if fields is not None:
+            # Fill unparsed fields from today at midnight, as dateutil.parser.parse does
+            # (its day is clamped to the month's length)
+            year, month = fields
+            today = datetime.now()
+            month = month or today.month
+            return datetime(year, month, min(today.day, monthrange(year, month)[1]))
         try:
             return date_parser.parse(date_str, fuzzy=True)
         except Exception:
             # Try MM/YYYY format
-            match = re.match(r'(\d{1,2})/(\d{4})', date_str)
+            match = self.MONTH_YEAR_REGEX.match(date_str)
             if match:
                 return datetime(int(match.group(2)), int(match.group(1)), 1)
             # Try just year
-            match = re.match(r'(\d{4})', date_str)
+            match = self.YEAR_ONLY_REGEX.match(date_str)
             if match:
                 return datetime(int(match.group(1)), 1, 1)
         return None
@@ -595,9 +773,10 @@ class ResumeParser:
     # ============================================================
     # RULE 5: WORK EXPERIENCE EXTRACTION
     # ============================================================
-    def extract_work_experience(self, text: str) -> List[Dict[str, Any]]:
+    def extract_work_experience(self, text: str, sections: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """Extract structured work experience entries."""
-        sections = self.sectionize(text)
+        if sections is None:
+            sections = self.sectionize(text)
         exp_text = sections.get('experience', '')
         
         if not exp_text:
@@ -607,19 +786,19 @@ class ResumeParser:
         lines = exp_text.split('\n')
         
         current_exp = None
+        date_range_search = self.DATE_RANGE_REGEX.search
+        is_job_title_line = self._is_job_title_line
         
         for line in lines:
             line = line.strip()
             if not line:
                 continue
             
-            line_lower = line.lower()
-            
             # 1. Check if line is a Date Range
-            date_match = self.DATE_RANGE_REGEX.search(line)
+            date_match = date_range_search(line)
             
             # 2. Check if line is a Job Title (with safeguards)
-            is_title = self._is_job_title_line(line)
+            is_title = is_job_title_line(line)
             
             if is_title:
                 # Try to extract company from title line
@@ -655,7 +834,7 @@ class ResumeParser:
             elif current_exp:
                 # Description processing
                 # Clean bullet points
-                clean_line = line.lstrip('-•*→▪▸ ').strip()
+                clean_line = line.lstrip(self.BULLET_CHARS).strip()
                 
                 if not current_exp['company'] and len(line.split()) <= 6 and not clean_line.startswith(('I ', 'We ')):
                      # Heuristic: Short line after title might be Company Name
@@ -691,28 +870,12 @@ class ResumeParser:
             return False
             
         # Check for keywords with boundaries
-        for keyword in self.JOB_TITLE_KEYWORDS:
-            # Use regex to avoid "architect" matching "architecture"
-            if re.search(r'\b' + re.escape(keyword) + r'\b', line_lower):
-                return True
-                
-        return False
+        return self.JOB_TITLE_REGEX.search(line_lower) is not None
     
     def _split_title_company(self, line: str) -> Tuple[str, str]:
         """Split a line into Title and Company if possible."""
-        # Common separators: |, -, at, for
-        separators = [
-            r'\s+\|\s+',           # " | "
-            r'\s+-\s+',            # " - " (but careful with hyphens in names)
-            r'\s+–\s+',            # En dash
-            r'\s+—\s+',            # Em dash
-            r'\s+at\s+',           # " at "
-            r'\s+for\s+',          # " for "
-            r',\s+'                # ", " with space
-        ]
-        
-        for sep in separators:
-            parts = re.split(sep, line, maxsplit=1, flags=re.IGNORECASE)
+        for sep in self.TITLE_COMPANY_SEPARATORS:
+            parts = sep.split(line, maxsplit=1)
             if len(parts) == 2:
                 # Heuristic: Check if parts look reasonable
                 # Title part should probably contain a job keyword
@@ -723,7 +886,7 @@ class ResumeParser:
     # ============================================================
     # RULE 8: PROJECT EXTRACTION with Title vs Description Detection
     # ============================================================
-    def extract_projects(self, text: str) -> List[Dict[str, Any]]:
+    def extract_projects(self, text: str, sections: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """
         Extract projects using advanced title vs description detection:
         - Rule A: Period Check (titles don't end with periods)
@@ -737,7 +900,8 @@ class ResumeParser:
         - Rule B: Parenthetical pattern: "Project Name (React, Node)"
         - Rule C: Connector words: "using", "built with"
         """
-        sections = self.sectionize(text)
+        if sections is None:
+            sections = self.sectionize(text)
         projects_text = sections.get('projects', '')
         
         if not projects_text:
@@ -752,57 +916,64 @@ class ResumeParser:
             if not line:
                 continue
             
+            # Lowercased once here and shared by the helpers below
+            line_lower = line.lower()
+            
             # Check if this line is a project title
-            is_title, title_confidence, extracted_title, extracted_tech = self._analyze_project_line(line)
+            is_title, title_confidence, extracted_title, extracted_tech = self._analyze_project_line(line, line_lower)
             
             if is_title and title_confidence >= 60:
                 # Save previous project if exists
                 if current_project:
-                    # Before saving, scan descriptions for any missed tech
                     self._extract_tech_from_descriptions(current_project)
                     projects.append(current_project)
                 
-                # Start new project
+                # Start new project; tech_stack is keyed by normalized name until the project is saved
                 current_project = {
                     'title': extracted_title,
-                    'tech_stack': extracted_tech if extracted_tech else [],
+                    'tech_stack': {},
                     'description': [],
                     'confidence': title_confidence
                 }
+                self._add_tech(current_project['tech_stack'], extracted_tech)
             elif current_project:
                 # This is a description line, add to current project
                 # Check for tech stack labels in description
-                tech_from_line = self._extract_tech_from_label(line)
+                tech_from_line = self._extract_tech_from_label(line, line_lower)
                 if tech_from_line:
-                    current_project['tech_stack'].extend(tech_from_line)
+                    self._add_tech(current_project['tech_stack'], tech_from_line)
                 else:
                     # Clean bullet points and add to description
-                    desc_line = line.lstrip('-•*→▪▸ ').strip()
+                    desc_line = line.lstrip(self.BULLET_CHARS).strip()
                     if desc_line:
                         current_project['description'].append(desc_line)
-                        # Also extract any tech mentions from the description
-                        tech_from_desc = self._extract_tech_from_text(desc_line)
+                        # Also extract any tech mentions from the description. Bullets and
+                        # whitespace have no case, so stripping the lowercased line gives
+                        # desc_line.lower() (without a copy when there was nothing to strip)
+                        desc_lower = line_lower.lstrip(self.BULLET_CHARS).strip()
+                        tech_from_desc = self._extract_tech_from_text(desc_line, desc_lower)
                         if tech_from_desc:
-                            current_project['tech_stack'].extend(tech_from_desc)
+                            self._add_tech(current_project['tech_stack'], tech_from_desc)
         
         # Don't forget the last project
         if current_project:
-            # Before saving, scan descriptions for any missed tech
             self._extract_tech_from_descriptions(current_project)
             projects.append(current_project)
         
         return projects
     
-    def _analyze_project_line(self, line: str) -> Tuple[bool, int, str, List[str]]:
+    def _analyze_project_line(self, line: str, line_lower: Optional[str] = None) -> Tuple[bool, int, str, List[str]]:
         """
         Analyze a line to determine if it's a project title.
+        line_lower may be passed when the caller already has line.lower() of a stripped line.
         Returns: (is_title, confidence, extracted_title, extracted_tech_stack)
         """
         confidence = 50  # Start neutral
         extracted_title = line
         extracted_tech = []
         
-        line_lower = line.lower().strip()
+        if line_lower is None:
+            line_lower = line.lower().strip()
         words = line.split()
         
         # ========== RULE A: Period Check ==========
@@ -818,19 +989,35 @@ class ResumeParser:
                 # Exception: check if followed by a noun (e.g., "Automated Testing Framework")
                 if len(words) > 1:
                     second_word = words[1].lower()
-                    if any(noun in second_word for noun in self.PROJECT_NOUN_SIGNALS):
+                    if self.PROJECT_NOUN_REGEX.search(second_word):
                         confidence += 10  # It's an adjective usage
                     else:
                         confidence -= 40  # Definitely a description
                 else:
                     confidence -= 40
         
+        # ========== RULE E: Length Limit ==========
+        # (scored before the noun and casing rules: it is the cheapest)
+        # Titles are typically short
+        word_count = len(words)
+        char_count = len(line)
+        
+        if word_count > 10 or char_count > 60:
+            confidence -= 25  # Too long for a title
+        elif word_count <= 5:
+            confidence += 10  # Short = likely title
+        
         # ========== RULE C: Noun Signal ==========
         # Check for project-indicating nouns
-        has_noun_signal = any(noun in line_lower for noun in self.PROJECT_NOUN_SIGNALS)
+        has_noun_signal = self.PROJECT_NOUN_REGEX.search(line_lower) is not None
         if has_noun_signal:
             confidence += 25  # Strong positive signal
         
+        # Casing adds at most 20 and the tech stack rules at most 15 + 10; skip them all
+        # when even that cannot reach the title threshold
+        if confidence + 45 < 60:
+            return (False, max(0, confidence), extracted_title, extracted_tech)
+        
         # ========== RULE D: Casing Heuristic ==========
         if line.isupper():
             # ALL CAPS = likely title
@@ -842,42 +1029,42 @@ class ResumeParser:
             # Starts lowercase = likely description
             confidence -= 15
         
-        # ========== RULE E: Length Limit ==========
-        # Titles are typically short
-        word_count = len(words)
-        char_count = len(line)
-        
-        if word_count > 10 or char_count > 60:
-            confidence -= 25  # Too long for a title
-        elif word_count <= 5:
-            confidence += 10  # Short = likely title
+        # The tech stack rules below add at most 15 + 10, so a line that cannot reach the
+        # title threshold even with both is rejected here without running their regexes
+        if confidence + 25 < 60:
+            return (False, max(0, confidence), extracted_title, extracted_tech)
         
         # ========== TECH STACK EXTRACTION ==========
         
         # Rule B: Parenthetical Pattern - "Project Name (React, Node, Mongo)"
-        paren_match = re.search(r'([^(]+)\s*\(([^)]+)\)\s*$', line)
+        # The regex backtracks across the whole line before failing, so only run it
+        # when the line has both parentheses
+        paren_match = self.PAREN_TECH_REGEX.search(line) if '(' in line and ')' in line else None
         if paren_match:
             extracted_title = paren_match.group(1).strip()
             paren_content = paren_match.group(2)
             # Check if parenthetical content looks like tech stack
-            potential_tech = [t.strip() for t in re.split(r'[,|/]', paren_content)]
+            potential_tech = [t.strip() for t in paren_content.replace('|', ',').replace('/', ',').split(',')]
             if self._looks_like_tech_stack(potential_tech):
                 extracted_tech = potential_tech
                 confidence += 15  # This is a common title format
         
         # Rule C: Connector Pattern - "Library System using Java and SQL"
-        for connector in self.TECH_STACK_CONNECTORS:
-            connector_pattern = rf'\s+{re.escape(connector)}\s+'
-            if re.search(connector_pattern, line_lower):
-                parts = re.split(connector_pattern, line, maxsplit=1, flags=re.IGNORECASE)
-                if len(parts) == 2:
-                    extracted_title = parts[0].strip()
-                    tech_part = parts[1].strip().rstrip('.')
-                    # Parse tech stack (comma or "and" separated)
-                    tech_items = re.split(r',\s*|\s+and\s+', tech_part)
-                    extracted_tech = [t.strip() for t in tech_items if t.strip()]
-                    confidence += 10
-                break
+        # When several connectors appear, the first in TECH_STACK_CONNECTORS order wins (not the
+        # leftmost), so the per-connector loop stays; the union search only skips it for lines
+        # without any connector
+        if self.TECH_STACK_CONNECTOR_ANY_REGEX.search(line_lower):
+            for connector_regex, connector_split_regex in self.TECH_STACK_CONNECTOR_REGEXES:
+                if connector_regex.search(line_lower):
+                    parts = connector_split_regex.split(line, maxsplit=1)
+                    if len(parts) == 2:
+                        extracted_title = parts[0].strip()
+                        tech_part = parts[1].strip().rstrip('.')
+                        # Parse tech stack (comma or "and" separated)
+                        tech_items = self.CONNECTOR_TECH_SPLIT_REGEX.split(tech_part)
+                        extracted_tech = [t.strip() for t in tech_items if t.strip()]
+                        confidence += 10
+                    break
         
         # Final determination
         is_title = confidence >= 60
@@ -893,41 +1080,33 @@ class ResumeParser:
         if not words:
             return False
         
-        # Allow small words to be lowercase (a, an, the, of, etc.)
-        small_words = {'a', 'an', 'the', 'of', 'in', 'on', 'at', 'to', 'for', 'and', 'or', 'but'}
+        # First word must be capitalized (words that are all special chars or numbers are skipped)
+        first_word = words[0]
+        if not first_word[0].isupper() and any(c.isalpha() for c in first_word):
+            return False
         
-        for i, word in enumerate(words):
-            # Skip if it's all special chars or numbers
-            if not any(c.isalpha() for c in word):
-                continue
-            
-            # First word must be capitalized
-            if i == 0:
-                if not word[0].isupper():
-                    return False
-            else:
-                # Small words can be lowercase
-                word_clean = word.lower().strip('(),.-:')
-                if word_clean in small_words:
-                    continue
-                # Other words should be capitalized
-                if word[0].isalpha() and not word[0].isupper():
-                    return False
+        small_words = self.TITLE_CASE_SMALL_WORDS
+        for word in words[1:]:
+            # Other words should be capitalized; only a word starting with a letter can fail,
+            # and small words can be lowercase
+            first_char = word[0]
+            if first_char.isalpha() and not first_char.isupper() and word.lower().strip('(),.-:') not in small_words:
+                return False
         
         return True
     
-    def _extract_tech_from_label(self, line: str) -> List[str]:
+    def _extract_tech_from_label(self, line: str, line_lower: Optional[str] = None) -> List[str]:
         """Extract tech stack from explicit labels like 'Tech Stack: React, Node'."""
-        line_lower = line.lower()
+        if line_lower is None:
+            line_lower = line.lower()
         
-        for label in self.TECH_STACK_LABELS:
-            if label in line_lower:
-                # Extract everything after the label
-                idx = line_lower.find(label)
-                tech_part = line[idx + len(label):].strip()
-                # Parse comma-separated or other separators
-                tech_items = re.split(r'[,|/•]', tech_part)
-                return [t.strip() for t in tech_items if t.strip()]
+        label_match = self.TECH_STACK_LABEL_REGEX.search(line_lower)
+        if label_match:
+            # Extract everything after the label
+            tech_part = line[label_match.end():].strip()
+            # Parse comma-separated or other separators
+            tech_items = tech_part.replace('|', ',').replace('/', ',').replace('•', ',').split(',')
+            return [t.strip() for t in tech_items if t.strip()]
         
         return []
     
@@ -944,12 +1123,13 @@ class ResumeParser:
                 if item_lower in self.KNOWN_SKILLS:
                     return True
                 # Check if it's short and looks like tech (no spaces, alphanumeric)
-                if len(item) <= 20 and re.match(r'^[A-Za-z0-9.#+-]+$', item.strip()):
+                if len(item) <= 20 and self.TECH_TOKEN_REGEX.match(item.strip()):
                     return True
             return False
         
         # For 3+ items, check if at least one is a known skill
-        known_count = sum(1 for item in items if item.lower().strip() in self.KNOWN_SKILLS)
+        known_skills = self.KNOWN_SKILLS
+        known_count = sum(1 for item in items if item.lower().strip() in known_skills)
         
         # Also check for common patterns (short, no spaces)
         tech_pattern_count = sum(1 for item in items 
@@ -958,58 +1138,39 @@ class ResumeParser:
         # At least one known skill OR most items look like tech names
         return known_count >= 1 or tech_pattern_count >= len(items) * 0.5
     
-    def _extract_tech_from_text(self, text: str) -> List[str]:
+    def _extract_tech_from_text(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract known technologies from a line of text."""
-        found_tech = []
-        text_lower = text.lower()
-        
-        # Scan for known skills in the text
-        for skill in self.KNOWN_SKILLS:
-            skill_lower = skill.lower()
-            # Skip ambiguous single-letter skills in general text
-            if skill_lower in self.AMBIGUOUS_SKILLS:
-                continue
-            
-            # Use word boundary matching
-            pattern = r'\b' + re.escape(skill_lower) + r'\b'
-            if re.search(pattern, text_lower):
-                # Normalize the skill name
-                formatted = skill.title() if len(skill) > 3 else skill.upper()
-                found_tech.append(formatted)
-        
-        return found_tech
+        # Ambiguous single-letter skills are never matched in general text
+        found = self._scan_known_skills(text.lower() if text_lower is None else text_lower)
+        return [display for skill_lower, display in self.KNOWN_SKILL_DISPLAY.items() if skill_lower in found]
     
-    def _extract_tech_from_descriptions(self, project: Dict) -> None:
-        """Deduplicate and clean up tech stack in a project."""
-        if not project.get('tech_stack'):
-            return
-        
-        # Normalize and deduplicate
-        seen = set()
-        unique_tech = []
-        
-        for tech in project['tech_stack']:
-            tech_normalized = tech.strip().lower()
-            if tech_normalized and tech_normalized not in seen:
-                seen.add(tech_normalized)
+    def _add_tech(self, tech_stack: Dict[str, str], items: List[str]) -> None:
+        """Add tech names to a project's tech_stack dict, keeping the first spelling of each."""
+        known_skills = self.KNOWN_SKILLS
+        for tech in items:
+            formatted = tech.strip()
+            tech_normalized = formatted.lower()
+            if tech_normalized and tech_normalized not in tech_stack:
                 # Preserve the original casing or format nicely
-                formatted = tech.strip()
-                if formatted.lower() in self.KNOWN_SKILLS:
+                if tech_normalized in known_skills:
                     formatted = formatted.title() if len(formatted) > 3 else formatted.upper()
-                unique_tech.append(formatted)
-        
-        project['tech_stack'] = unique_tech
+                tech_stack[tech_normalized] = formatted
+    
+    def _extract_tech_from_descriptions(self, project: Dict) -> None:
+        """Turn a project's deduplicated tech_stack dict into the final list."""
+        project['tech_stack'] = list(project['tech_stack'].values())
 
     # ============================================================
     # RULE 6: SKILLS EXTRACTION with Contextual Density
     # ============================================================
-    def extract_skills(self, text: str) -> List[ExtractedField]:
+    def extract_skills(self, text: str, sections: Optional[Dict[str, str]] = None) -> List[ExtractedField]:
         """
         Extract skills using:
         - Block First Rule: Prioritize Skills Zone
         - Ambiguity Guard: Handle short skills carefully
         """
-        sections = self.sectionize(text)
+        if sections is None:
+            sections = self.sectionize(text)
         skills_zone = sections.get('skills', '')
         
         found_skills = []
@@ -1033,35 +1194,41 @@ class ResumeParser:
         
         return found_skills
     
+    def _scan_known_skills(self, text_lower: str) -> set:
+        """Lowercase non-ambiguous skills occurring as whole words in text_lower, in one scan."""
+        found = set()
+        for match in self.SKILL_SCANNER.finditer(text_lower):
+            skill_lower = match.group(1)
+            found.add(skill_lower)
+            found.update(self.SKILL_SCANNER_IMPLIED[skill_lower])
+        return found
+    
     def _extract_skills_from_text(self, text: str, is_skills_zone: bool) -> List[ExtractedField]:
         """Extract skills from given text with confidence based on zone."""
         skills = []
         text_lower = text.lower()
         confidence = 90 if is_skills_zone else 70
         
-        for skill in self.KNOWN_SKILLS:
-            skill_lower = skill.lower()
-            
+        # One scan finds every non-ambiguous skill; results keep KNOWN_SKILLS order
+        found = self._scan_known_skills(text_lower)
+        ambiguous_skills = self.AMBIGUOUS_SKILLS
+        ambiguous_regexes = self.AMBIGUOUS_SKILL_REGEXES
+        
+        for skill_lower, display in self.KNOWN_SKILL_DISPLAY.items():
             # Ambiguity Guard for short/ambiguous skills (C, R, Go, Vue, etc.)
-            if skill_lower in self.AMBIGUOUS_SKILLS:
+            if skill_lower in ambiguous_skills:
                 # For ambiguous skills, require comma-separation to avoid false positives
-                # Pattern: skill must be preceded by start/comma and followed by comma/end
-                comma_pattern = rf'(?:^|,\s*){re.escape(skill_lower)}(?:\s*,|\s*$)'
-                
-                # Must ACTUALLY match the comma pattern in the text
-                if re.search(comma_pattern, text_lower):
+                if ambiguous_regexes[skill_lower].search(text_lower):
                     skills.append(ExtractedField(
-                        value=skill.upper(),  # Short skills like C, R should be uppercase
+                        value=skill_lower.upper(),  # Short skills like C, R should be uppercase
                         confidence=confidence - 5  # Slightly lower for ambiguous
                     ))
-            else:
+            elif skill_lower in found:
                 # Normal skill matching with word boundaries
-                pattern = r'\b' + re.escape(skill_lower) + r'\b'
-                if re.search(pattern, text_lower):
-                    skills.append(ExtractedField(
-                        value=skill.title() if len(skill) > 3 else skill.upper(),
-                        confidence=confidence
-                    ))
+                skills.append(ExtractedField(
+                    value=display,
+                    confidence=confidence
+                ))
         
         return skills
 
@@ -1075,67 +1242,81 @@ class ResumeParser:
         - City Matching
         - State Fallback
         """
-        text_lower = text.lower()
-        
-        # Try Pincode first
-        pincode_matches = self.PINCODE_REGEX.findall(text)
-        for pincode in pincode_matches:
+        # Try Pincode first; matches are scanned lazily so the first mapped one ends the search
+        for pincode_match in self.PINCODE_REGEX.finditer(text):
             # Map pincode prefix to city
-            prefix = pincode[:3]
-            if prefix in self.PINCODE_CITY_MAP:
-                city = self.PINCODE_CITY_MAP[prefix]
+            pincode = pincode_match.group()
+            city = self.PINCODE_CITY_MAP.get(pincode[:3])
+            if city is not None:
                 return ExtractedField(
                     value=f"{city} ({pincode})",
                     confidence=90
                 )
         
+        text_lower = text.lower()
+        
         # Try City matching
-        for city in self.INDIAN_CITIES:
-            if city in text_lower:
-                return ExtractedField(
-                    value=city.title(),
-                    confidence=85
-                )
+        city_match = self.INDIAN_CITY_REGEX.search(text_lower)
+        if city_match:
+            return ExtractedField(
+                value=city_match.group(0).title(),
+                confidence=85
+            )
         
         # Fallback: State matching
-        for state in self.INDIAN_STATES:
-            if state in text_lower:
-                return ExtractedField(
-                    value=state.title(),
-                    confidence=70
-                )
+        state_match = self.INDIAN_STATE_REGEX.search(text_lower)
+        if state_match:
+            return ExtractedField(
+                value=state_match.group(0).title(),
+                confidence=70
+            )
         
         return ExtractedField(value="", confidence=0)
 
+    # ============================================================
+    # FULL PARSE
+    # ============================================================
+    def parse_fields(self, text: str) -> Dict[str, Any]:
+        """Run every field extractor over resume text, sectionizing it only once."""
+        sections = self.sectionize(text)
+        return {
+            'full_name': self.extract_name(text),
+            'email': self.extract_email(text),
+            'phone': self.extract_phone(text),
+            'years_of_experience': self.extract_experience_years(text, sections),
+            'skills': self.extract_skills(text, sections),
+            'education': self.extract_education(text, sections),
+            'work_experience': self.extract_work_experience(text, sections),
+            'projects': self.extract_projects(text, sections),
+        }
+
     # ============================================================
     # OVERALL CONFIDENCE CALCULATION
     # ============================================================
+    # Weights for email, phone, name, experience, skills, education, in summation order
+    CONFIDENCE_WEIGHTS = (0.20, 0.15, 0.20, 0.10, 0.30, 0.05)
+
     def calculate_overall_confidence(self, parsed: Dict) -> int:
         """Calculate weighted overall confidence score."""
-        weights = {
-            'email': 0.20,
-            'phone': 0.15,
-            'full_name': 0.20,
-            'skills': 0.30,
-            'experience': 0.10,
-            'education': 0.05
-        }
-        
-        total = 0
-        total += parsed['email'].confidence * weights['email']
-        total += parsed['phone'].confidence * weights['phone']
-        total += parsed['full_name'].confidence * weights['full_name']
-        total += parsed['years_of_experience'].confidence * weights['experience']
-        
         # Skills confidence is average of all found skills
-        if parsed['skills']:
-            avg_skill_conf = sum(s.confidence for s in parsed['skills']) / len(parsed['skills'])
-            total += avg_skill_conf * weights['skills']
+        skills = parsed['skills']
+        avg_skill_conf = sum(s.confidence for s in skills) / len(skills) if skills else 0.0
         
         # Education confidence
-        if parsed.get('education'):
-            avg_edu_conf = sum(e.get('confidence', 50) for e in parsed['education']) / len(parsed['education'])
-            total += avg_edu_conf * weights['education']
+        education = parsed.get('education')
+        avg_edu_conf = (
+            sum(e.get('confidence', 50) for e in education) / len(education) if education else 0.0
+        )
+        
+        confidences = (
+            parsed['email'].confidence,
+            parsed['phone'].confidence,
+            parsed['full_name'].confidence,
+            parsed['years_of_experience'].confidence,
+            avg_skill_conf,
+            avg_edu_conf,
+        )
+        total = sum([c * w for c, w in zip(confidences, self.CONFIDENCE_WEIGHTS)])
         
         return min(100, int(total))
 
@@ -1143,11 +1324,52 @@ class ResumeParser:
     # FILE EXTRACTION UTILITIES
     # ============================================================
     @staticmethod
-    def extract_text_from_pdf(content: bytes) -> str:
+    def _as_stream(content: Union[bytes, BinaryIO]) -> BinaryIO:
+        """Wrap raw bytes in a BytesIO; seekable file objects are used as-is."""
+        if isinstance(content, (bytes, bytearray)):
+            return io.BytesIO(content)
+        return content
+
+    @staticmethod
+    def extract_text_from_pdf(content: Union[bytes, BinaryIO]) -> str:
+        """
+        Extract text from PDF using pypdfium2 (native PDFium), falling back to pdfplumber.
+        Accepts raw bytes or a seekable binary file object (e.g. an upload's spool file).
+        """
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            return ResumeParser._extract_text_from_pdf_pdfplumber(content)
+        # Remember where a file object starts so the fallback can re-read it
+        start = None if isinstance(content, (bytes, bytearray)) else content.tell()
+        try:
+            pdf = pdfium.PdfDocument(content)
+            try:
+                text_parts = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    if page_text.strip():
+                        # PDFium separates lines with CRLF
+                        text_parts.append(page_text.replace('\r\n', '\n').replace('\r', '\n'))
+                return '\n'.join(text_parts)
+            finally:
+                pdf.close()
+        except Exception:
+            # PDFium rejects some files pdfminer can still read; give pdfplumber a try,
+            # which returns its own error string if it fails too
+            if start is not None:
+                content.seek(start)
+            return ResumeParser._extract_text_from_pdf_pdfplumber(content)
+
+    @staticmethod
+    def _extract_text_from_pdf_pdfplumber(content: Union[bytes, BinaryIO]) -> str:
         """Extract text from PDF using pdfplumber."""
         try:
             import pdfplumber
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
+            with pdfplumber.open(ResumeParser._as_stream(content)) as pdf:
                 text_parts = []
                 for page in pdf.pages:
                     page_text = page.extract_text()
@@ -1160,14 +1382,46 @@ class ResumeParser:
             return f"[PDF parsing error: {str(e)}]"
     
     @staticmethod
-    def extract_text_from_docx(content: bytes) -> str:
-        """Extract text from DOCX using python-docx."""
+    def extract_text_from_docx(content: Union[bytes, BinaryIO]) -> str:
+        """Extract text from DOCX using python-docx. Accepts raw bytes or a seekable binary file object."""
         try:
             from docx import Document
-            doc = Document(io.BytesIO(content))
+            doc = Document(ResumeParser._as_stream(content))
             paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
             return '\n'.join(paragraphs)
         except ImportError:
             return "[DOCX parsing library not available]"
         except Exception as e:
             return f"[DOCX parsing error: {str(e)}]"
+
+
+# ============================================================
+# BULK PARSING
+# ============================================================
+_worker_parser: Optional[ResumeParser] = None
+
+
+def _parse_one(content: bytes) -> Tuple[str, Dict[str, Any]]:
+    """Worker: PDF bytes in, (text, parsed fields) out. One parser per worker process."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ResumeParser()
+    text = ResumeParser.extract_text_from_pdf(content)
+    return text, _worker_parser.parse_fields(text)
+
+
+def parse_many(contents: List[bytes], max_workers: Optional[int] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Parse a batch of PDF resumes across a process pool, so PDF decoding and the
+    regex passes run on every core instead of taking turns on the GIL.
+    Returns (text, parsed fields) per input, in input order.
+    Batches of one (or max_workers=1) are parsed in this process.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(contents) < 2:
+        return [_parse_one(content) for content in contents]
+    workers = min(max_workers, len(contents))
+    # Up to 8 resumes per task to cut IPC round trips, but never so many that workers sit idle
+    chunksize = max(1, min(8, len(contents) // workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_one, contents, chunksize=chunksize))
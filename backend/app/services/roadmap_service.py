@@ -2,7 +2,8 @@
 Roadmap Generator Service
 Generates personalized learning paths based on skill gaps
 """
-from typing import List
+from functools import lru_cache
+from typing import AbstractSet, Dict, List, Sequence, Tuple
 
 from ..schemas.roadmap import LearningResource, SkillNode, LearningPhase
 
@@ -20,6 +21,10 @@ class RoadmapGenerator:
         "You'll be ready for senior-level responsibilities"
     ]
     
+    # Phase duration: skills in a phase overlap, and the learner's pace scales the total
+    PARALLEL_FACTOR = 0.7
+    PACE_MULTIPLIERS = {"intensive": 0.6, "moderate": 1.0, "relaxed": 1.5}
+    
     # Skill resources database
     SKILL_RESOURCES = {
         "python": {
@@ -126,43 +131,99 @@ class RoadmapGenerator:
         }
     }
     
-    def topological_sort_skills(self, missing_skills: List[str]) -> List[List[str]]:
-        """Sort skills into phases based on dependencies using Kahn's algorithm"""
-        missing_lower = {s.lower() for s in missing_skills}
-        
-        # Build dependency graph
-        dependencies = {}
+    # Skill -> lowercased prerequisite names, derived once from the static table.
+    # SKILL_RESOURCES is keyed by lowercase name, so lookups need no case-folding.
+    SKILL_PREREQUISITES = {
+        skill: frozenset(p.lower() for p in data.get('prerequisites', []))
+        for skill, data in SKILL_RESOURCES.items()
+    }
+    
+    # Skill -> validated LearningResource models, also built once. The models are never
+    # mutated after construction, so every SkillNode for a skill can share them.
+    SKILL_LEARNING_RESOURCES = {
+        skill: tuple(LearningResource(**res) for res in data.get('resources', []))
+        for skill, data in SKILL_RESOURCES.items()
+    }
+    # Skill -> total hours of those resources (skills without any get the generic fallback)
+    SKILL_RESOURCE_HOURS = {
+        skill: sum(res.estimated_hours for res in resources)
+        for skill, resources in SKILL_LEARNING_RESOURCES.items()
+        if resources
+    }
+    # (skill, is_required) -> SkillNode for table skills, filled on first use. Nodes are
+    # never mutated after construction, so roadmaps can share them.
+    _skill_nodes: Dict[Tuple[str, bool], SkillNode] = {}
+    
+    def topological_sort_skills(self, missing_skills: List[str]) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Sort skills into phases based on dependencies using Kahn's algorithm.
+        Returns the cached, immutable phases, so repeat calls share them.
+        """
+        return self._sorted_phases(frozenset(s.lower() for s in missing_skills))
+    
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _sorted_phases(cls, missing_lower: frozenset) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Phases for a set of lowercase missing skills. The skill graph is static, so results
+        are cached per set: repeat roadmaps for the same job and skills skip the sort.
+        """
+        # Build dependency graph: missing prerequisite -> dependents, and a count of each
+        # skill's missing prerequisites
+        dependents = {}
+        indegree = {}
         for skill in missing_lower:
-            skill_data = self.SKILL_RESOURCES.get(skill, {})
-            prereqs = skill_data.get('prerequisites', [])
-            dependencies[skill] = {p for p in prereqs if p.lower() in missing_lower}
+            prerequisites = cls.SKILL_PREREQUISITES.get(skill, frozenset()) & missing_lower
+            indegree[skill] = len(prerequisites)
+            for prerequisite in prerequisites:
+                dependents.setdefault(prerequisite, []).append(skill)
         
+        # Each phase is one wave: the skills whose last missing prerequisite was in the
+        # previous phase. Phases list skills in missing_lower iteration order.
+        order = {skill: i for i, skill in enumerate(missing_lower)}
         phases = []
-        remaining = set(missing_lower)
+        phase = [s for s in missing_lower if indegree[s] == 0]
+        placed = 0
         
-        while remaining:
-            phase = [s for s in remaining if not (dependencies.get(s, set()) & remaining)]
-            if not phase:
-                phases.append(list(remaining))
-                break
-            phases.append(phase)
-            remaining -= set(phase)
+        while phase:
+            phases.append(tuple(phase))
+            placed += len(phase)
+            next_phase = []
+            for skill in phase:
+                for dependent in dependents.get(skill, ()):
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        next_phase.append(dependent)
+            next_phase.sort(key=order.__getitem__)
+            phase = next_phase
         
-        return phases
+        # Skills on or behind a dependency cycle never reach zero; they form a final phase
+        if placed < len(missing_lower):
+            phases.append(tuple(s for s in missing_lower if indegree[s] > 0))
+        
+        return tuple(phases)
     
-    def get_skill_node(self, skill_name: str, job_required_skills: List[str]) -> SkillNode:
-        """Create a SkillNode with full details"""
-        skill_data = self.SKILL_RESOURCES.get(skill_name.lower(), {})
-        is_required = skill_name.lower() in [s.lower() for s in job_required_skills]
+    def get_skill_node(self, skill_name: str, required_lower: AbstractSet[str]) -> SkillNode:
+        """Create a SkillNode with full details. required_lower holds the job's required skills, lowercased"""
+        skill_lower = skill_name.lower()
+        is_required = skill_lower in required_lower
+        # Only lowercase table names are cached (build_phases always passes those), which
+        # bounds the cache at two nodes per table skill
+        cacheable = skill_name == skill_lower and skill_lower in self.SKILL_RESOURCES
+        if cacheable:
+            node = self._skill_nodes.get((skill_lower, is_required))
+            if node is not None:
+                return node
+        skill_data = self.SKILL_RESOURCES.get(skill_lower, {})
         
-        resources = [LearningResource(**res) for res in skill_data.get('resources', [])]
+        resources = list(self.SKILL_LEARNING_RESOURCES.get(skill_lower, ()))
         if not resources:
             resources = [LearningResource(
                 title=f"Learn {skill_name.title()}", type="tutorial",
                 provider="Various", estimated_hours=10, is_free=True
             )]
         
-        return SkillNode(
+        node = SkillNode(
             name=skill_name.title(),
             category=skill_data.get('category', 'Technical'),
             difficulty=skill_data.get('difficulty', 3),
@@ -171,37 +232,56 @@ class RoadmapGenerator:
             resources=resources,
             why_needed="Required skill for this role" if is_required else "Nice-to-have skill"
         )
+        if cacheable:
+            self._skill_nodes[(skill_lower, is_required)] = node
+        return node
     
     def calculate_phase_weeks(self, skills: List[SkillNode], pace: str) -> float:
         """Calculate total weeks for a phase based on learning pace"""
         base_weeks = sum(s.estimated_weeks for s in skills)
-        parallel_factor = 0.7
-        
-        pace_multipliers = {"intensive": 0.6, "moderate": 1.0, "relaxed": 1.5}
-        multiplier = pace_multipliers.get(pace, 1.0)
+        multiplier = self.PACE_MULTIPLIERS.get(pace, 1.0)
         
-        return round(base_weeks * parallel_factor * multiplier, 1)
+        return round(base_weeks * self.PARALLEL_FACTOR * multiplier, 1)
     
     def build_phases(
-        self, skill_phases: List[List[str]], required_skills: List[str], pace: str
+        self, skill_phases: Sequence[Sequence[str]], required_skills: List[str], pace: str
     ) -> tuple[List[LearningPhase], float, int]:
         """Build detailed learning phases"""
         phases = []
         total_weeks = 0
         total_hours = 0
+        required_lower = {s.lower() for s in required_skills}
+        multiplier = self.PACE_MULTIPLIERS.get(pace, 1.0)
+        resource_hours = self.SKILL_RESOURCE_HOURS
+        # Phases past the last title / milestone reuse it
+        titles = self.PHASE_TITLES
+        milestones = self.PHASE_MILESTONES
+        last_title = len(titles) - 1
+        last_milestone = len(milestones) - 1
         
         for i, phase_skills in enumerate(skill_phases):
-            skill_nodes = [self.get_skill_node(s, required_skills) for s in phase_skills]
-            phase_weeks = self.calculate_phase_weeks(skill_nodes, pace)
-            phase_hours = sum(sum(r.estimated_hours for r in s.resources) for s in skill_nodes)
+            # One pass builds the nodes and sums their weeks and resource hours
+            # (same arithmetic as calculate_phase_weeks)
+            skill_nodes = []
+            base_weeks = 0
+            phase_hours = 0
+            for skill in phase_skills:
+                node = self.get_skill_node(skill, required_lower)
+                skill_nodes.append(node)
+                base_weeks += node.estimated_weeks
+                hours = resource_hours.get(skill.lower())
+                if hours is None:
+                    hours = sum(resource.estimated_hours for resource in node.resources)
+                phase_hours += hours
+            phase_weeks = round(base_weeks * self.PARALLEL_FACTOR * multiplier, 1)
             
             phases.append(LearningPhase(
                 phase_number=i + 1,
-                title=self.PHASE_TITLES[min(i, len(self.PHASE_TITLES) - 1)],
+                title=titles[min(i, last_title)],
                 description=f"Learn {', '.join(s.name for s in skill_nodes)}",
                 skills=skill_nodes,
                 total_weeks=phase_weeks,
-                milestone=self.PHASE_MILESTONES[min(i, len(self.PHASE_MILESTONES) - 1)]
+                milestone=milestones[min(i, last_milestone)]
             ))
             
             total_weeks += phase_weeks
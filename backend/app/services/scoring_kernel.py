@@ -0,0 +1,132 @@
+"""
+Scoring Kernel
+Numeric core of the matching engine: skill overlap, salary, experience and the
+weighted total for every job in a single call.
+Compiled with Numba when it is installed, otherwise evaluated with NumPy.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _score_all_numpy(
+    skill_hits, required, optional, salary_min, salary_max, min_experience,
+    expected_salary, candidate_years, location_scores, role_scores, weights
+):
+    """Vectorized fallback. Returns (components [N, 5], totals [N])"""
+    hits = skill_hits.astype(np.int32)
+    required_count = required.sum(axis=1)
+    optional_count = optional.sum(axis=1)
+
+    # Skills: 80% required + 20% optional
+    with np.errstate(divide='ignore', invalid='ignore'):
+        req_score = np.where(required_count > 0, (required @ hits) / required_count * 100, 100.0)
+        opt_score = np.where(optional_count > 0, (optional @ hits) / optional_count * 100, 100.0)
+    skill_scores = np.where(
+        (required_count == 0) & (optional_count == 0), 100.0, req_score * 0.8 + opt_score * 0.2
+    )
+
+    # Salary
+    with np.errstate(divide='ignore', invalid='ignore'):
+        below = 100 - (salary_min - expected_salary) / salary_min * 100
+        above = 100 - (expected_salary - salary_max) / salary_max * 100
+    salary_scores = np.where(
+        expected_salary < salary_min, below,
+        np.where(expected_salary > salary_max, above, 100.0)
+    )
+    salary_scores = np.nan_to_num(np.maximum(salary_scores, 0), nan=0.0)
+
+    # Experience
+    with np.errstate(divide='ignore', invalid='ignore'):
+        partial = np.where(min_experience > 0, candidate_years / min_experience * 100, 100.0)
+    experience_scores = np.where(candidate_years >= min_experience, 100.0, partial)
+
+    components = np.column_stack(
+        (skill_scores, location_scores, salary_scores, experience_scores, role_scores)
+    )
+    # Summed left to right like MatchingEngine.calculate_total_score (a dot product
+    # may add in another order and land on the other side of a rounding boundary)
+    totals = (
+        skill_scores * weights[0] + location_scores * weights[1] + salary_scores * weights[2] +
+        experience_scores * weights[3] + role_scores * weights[4]
+    )
+    return components, totals
+
+
+def _score_all_loop(
+    skill_hits, required, optional, salary_min, salary_max, min_experience,
+    expected_salary, candidate_years, location_scores, role_scores, weights
+):
+    """Per-job loop written for Numba. Same contract as _score_all_numpy"""
+    n_jobs, n_skills = required.shape
+    components = np.empty((n_jobs, 5))
+    totals = np.empty(n_jobs)
+
+    for i in range(n_jobs):
+        req_total = 0
+        req_hit = 0
+        opt_total = 0
+        opt_hit = 0
+        for j in range(n_skills):
+            if required[i, j]:
+                req_total += 1
+                if skill_hits[j]:
+                    req_hit += 1
+            if optional[i, j]:
+                opt_total += 1
+                if skill_hits[j]:
+                    opt_hit += 1
+        if req_total == 0 and opt_total == 0:
+            skill = 100.0
+        else:
+            req_score = req_hit / req_total * 100 if req_total > 0 else 100.0
+            opt_score = opt_hit / opt_total * 100 if opt_total > 0 else 100.0
+            skill = req_score * 0.8 + opt_score * 0.2
+
+        job_min = salary_min[i]
+        job_max = salary_max[i]
+        if expected_salary < job_min:
+            salary = max(0.0, 100 - (job_min - expected_salary) / job_min * 100) if job_min > 0 else 0.0
+        elif expected_salary > job_max:
+            salary = max(0.0, 100 - (expected_salary - job_max) / job_max * 100) if job_max > 0 else 0.0
+        else:
+            salary = 100.0
+
+        min_exp = min_experience[i]
+        if candidate_years >= min_exp:
+            experience = 100.0
+        else:
+            experience = candidate_years / min_exp * 100 if min_exp > 0 else 100.0
+
+        components[i, 0] = skill
+        components[i, 1] = location_scores[i]
+        components[i, 2] = salary
+        components[i, 3] = experience
+        components[i, 4] = role_scores[i]
+
+        total = 0.0
+        for k in range(5):
+            total += components[i, k] * weights[k]
+        totals[i] = total
+
+    return components, totals
+
+
+if njit is not None:
+    score_all = njit(cache=True)(_score_all_loop)
+else:
+    score_all = _score_all_numpy
+
+
+def warm_up() -> None:
+    """
+    Compile (or load the cached build of) the Numba kernel.
+    Called from app startup rather than at import so importing the package stays cheap.
+    """
+    score_all(
+        np.zeros(1, dtype=np.bool_), np.zeros((1, 1), dtype=np.bool_), np.zeros((1, 1), dtype=np.bool_),
+        np.zeros(1), np.zeros(1), np.zeros(1), 0.0, 0.0, np.zeros(1), np.zeros(1), np.zeros(5)
+    )
@@ -1,9 +1,13 @@
+import os
 from passlib.context import CryptContext
 import bcrypt
 
+# This only checks that passlib and bcrypt work together, so the cheapest work factor will do
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 4))
+
 print(f"Bcrypt version: {bcrypt.__version__}")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=BCRYPT_ROUNDS, deprecated="auto")
 
 password = "password123"
 print(f"Testing password: {password} (len: {len(password)})")
@@ -16,7 +20,7 @@ except Exception as e:
 
 try:
     # Direct bcrypt test
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(BCRYPT_ROUNDS)
     hashed_direct = bcrypt.hashpw(password.encode('utf-8'), salt)
     print(f"Direct bcrypt hashed: {hashed_direct}")
 except Exception as e:
@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 import pytest
 import sys
 from fastapi.testclient import TestClient
@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.main import app
 from app.db.database import Base, get_db
 from app.db.models import JobPosting
+from app.routers.matching import invalidate_job_corpus
 
 # SQLite test database (in-memory)
 SQLALCHEMY_DATABASE_URL = "sqlite://"
@@ -29,33 +30,20 @@ def setup_database():
     """Create tables and seed with jobs.json data"""
     Base.metadata.create_all(bind=engine)
     
-    db = TestingSessionLocal()
-    
     # Load jobs from backend/data/jobs.json
     jobs_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "jobs.json")
-    with open(jobs_path, "r") as f:
-        data = json.load(f)
+    with open(jobs_path, "rb") as f:
+        data = orjson.loads(f.read())
         jobs = data.get("jobs", [])
     
-    for job_data in jobs:
-        job = JobPosting(
-            id=job_data["id"],
-            title=job_data["title"],
-            company=job_data["company"],
-            description=job_data["description"],
-            location=job_data["location"],
-            is_remote=job_data["is_remote"],
-            salary_min=job_data["salary_min"],
-            salary_max=job_data["salary_max"],
-            min_experience_years=job_data["min_experience_years"],
-            max_experience_years=job_data["max_experience_years"],
-            required_skills=job_data["required_skills"],
-            nice_to_have_skills=job_data["nice_to_have_skills"]
-        )
-        db.add(job)
-    
-    db.commit()
-    db.close()
+    # One executemany through Core instead of an ORM object per job
+    columns = JobPosting.__table__.columns.keys()
+    rows = [{column: job_data[column] for column in columns} for job_data in jobs]
+    if rows:
+        with engine.begin() as conn:
+            conn.execute(JobPosting.__table__.insert(), rows)
+        # Core writes on a bare connection bypass the Session commit hook
+        invalidate_job_corpus()
     yield
     Base.metadata.drop_all(bind=engine)
 
@@ -68,6 +56,7 @@ def override_get_db():
 
 app.dependency_overrides[get_db] = override_get_db
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client():
+    """One TestClient shared by every test; no test changes dependency overrides"""
     return TestClient(app)
@@ -0,0 +1,54 @@
+import io
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import UploadFile
+from jose import JWTError
+
+from app.routers import auth
+
+
+@pytest.fixture
+def empty_token_cache():
+    """Run with an empty verified-token cache and leave none of the test's entries behind"""
+    auth._verified_tokens.clear()
+    yield
+    auth._verified_tokens.clear()
+
+def test_decode_access_token_reuses_verified_claims(monkeypatch, empty_token_cache):
+    """A verified token is served from the cache until its TTL runs out"""
+    token = auth.create_access_token({"sub": "42"})
+    payload = auth.decode_access_token(token)
+    assert payload["sub"] == "42"
+
+    def reject(*args, **kwargs):
+        raise JWTError("signature verification skipped by the cache")
+    monkeypatch.setattr(auth.jwt, "decode", reject)
+
+    assert auth.decode_access_token(token) == payload
+    with pytest.raises(JWTError):
+        auth.decode_access_token(auth.create_access_token({"sub": "7"}))
+
+    later = time.monotonic() + auth.AUTH_VERIFY_CACHE_TTL + 1
+    monkeypatch.setattr(auth, "time", SimpleNamespace(monotonic=lambda: later, time=time.time))
+    with pytest.raises(JWTError):
+        auth.decode_access_token(token)
+
+def test_save_upload_reuses_file_with_same_content(monkeypatch, tmp_path):
+    """Uploads are named by content hash: the same bytes map to one stored file"""
+    monkeypatch.setattr(auth, "UPLOAD_DIR", str(tmp_path))
+
+    def upload(content, filename="photo.png"):
+        return UploadFile(file=io.BytesIO(content), filename=filename)
+
+    first = auth.save_upload(upload(b"same image bytes"), "profile_1")
+    again = auth.save_upload(upload(b"same image bytes"), "profile_1")
+    other = auth.save_upload(upload(b"another image"), "profile_1")
+
+    assert first == again
+    assert first.startswith("profile_1_") and first.endswith(".png")
+    assert other != first
+    # No temp files are left next to the stored uploads
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([first, other])
+    assert (tmp_path / first).read_bytes() == b"same image bytes"
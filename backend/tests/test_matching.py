@@ -1,4 +1,15 @@
+import json
+import os
+
+import numpy as np
 import pytest
+from sqlalchemy import update
+
+from app.db.models import JobPosting
+from app.routers import matching
+from app.services.matching_service import MatchingEngine, JobCorpus
+from app.services.scoring_kernel import _score_all_numpy, _score_all_loop
+from conftest import TestingSessionLocal
 
 def test_calculate_matches_success(client):
     """Test successful matching calculation with sample candidate"""
@@ -85,3 +96,128 @@ def test_missing_skills_explanation(client):
     assert job1_match is not None
     assert "FastAPI" in job1_match["missing_skills"]
     assert "AWS" in job1_match["missing_skills"]
+
+def test_calculate_matches_pagination(client):
+    """limit/offset return a slice of the full ranking"""
+    candidate_data = {"skills": ["Python", "React"], "preferred_locations": ["Bangalore"]}
+    
+    full = client.post("/api/matching/calculate", json=candidate_data).json()["matches"]
+    page = client.post("/api/matching/calculate?limit=2&offset=1", json=candidate_data).json()["matches"]
+    
+    assert len(full) > 2
+    assert [m["job_id"] for m in page] == [m["job_id"] for m in full[1:3]]
+
+def test_calculate_matches_min_tier(client):
+    """min_tier keeps only matches scoring at or above the tier cutoff, in ranking order"""
+    candidate_data = {
+        "skills": ["Python", "FastAPI", "PostgreSQL", "Docker", "React"],
+        "experience_years": 2,
+        "preferred_locations": ["Bangalore"],
+        "preferred_roles": ["Backend Developer"],
+        "expected_salary": 1000000
+    }
+    
+    full = client.post("/api/matching/calculate", json=candidate_data).json()["matches"]
+    fair = client.post("/api/matching/calculate?min_tier=fair", json=candidate_data).json()["matches"]
+    
+    assert 0 < len(fair) < len(full)
+    assert [m["job_id"] for m in fair] == [m["job_id"] for m in full if m["match_score"] >= 50]
+    assert client.post("/api/matching/calculate?min_tier=best", json=candidate_data).status_code == 422
+
+def test_vectorized_scores_match_scalar_scores():
+    """score_corpus must agree with the per-job scoring methods"""
+    jobs_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "jobs.json")
+    with open(jobs_path, "r") as f:
+        jobs = json.load(f)["jobs"]
+
+    engine = MatchingEngine()
+    candidate = {
+        "skills": ["Python3", "FastAPI", "Docker", "ReactJS"],
+        "experience_years": 1,
+        "preferred_locations": ["Bangalore", "Hyderabad"],
+        "preferred_roles": ["Backend Developer", "Full Stack Developer"],
+        "expected_salary": 800000,
+    }
+    components, totals, _ = engine.score_corpus(candidate, JobCorpus(jobs))
+
+    for i, job in enumerate(jobs):
+        skill_score = engine.calculate_skills_score(
+            candidate["skills"], job["required_skills"], job["nice_to_have_skills"]
+        )[0]
+        expected = [
+            skill_score,
+            engine.calculate_location_score(candidate["preferred_locations"], job["location"]),
+            engine.calculate_salary_score(candidate["expected_salary"], job["salary_min"], job["salary_max"]),
+            engine.calculate_experience_score(candidate["experience_years"], job["min_experience_years"]),
+            engine.calculate_role_score(candidate["preferred_roles"], job["title"]),
+        ]
+        assert components[i].tolist() == pytest.approx(expected)
+        assert round(float(totals[i]), 1) == engine.calculate_total_score(dict(zip(
+            ["skill_match", "location_match", "salary_match", "experience_match", "role_match"], expected
+        )))
+
+def test_scoring_kernel_numpy_and_loop_agree():
+    """The NumPy fallback and the Numba loop kernel must produce the same scores"""
+    rng = np.random.default_rng(0)
+    n_jobs, n_skills = 50, 20
+    args = (
+        rng.random(n_skills) > 0.5,
+        rng.random((n_jobs, n_skills)) > 0.7,
+        rng.random((n_jobs, n_skills)) > 0.8,
+        rng.integers(0, 2_000_000, n_jobs).astype(np.float64),
+        rng.integers(1_000_000, 4_000_000, n_jobs).astype(np.float64),
+        rng.integers(0, 8, n_jobs).astype(np.float64),
+        1_500_000.0,
+        3.0,
+        rng.choice([0.0, 80.0, 100.0], n_jobs),
+        rng.integers(0, 101, n_jobs).astype(np.float64),
+        np.array([0.4, 0.2, 0.15, 0.15, 0.1]),
+    )
+    numpy_components, numpy_totals = _score_all_numpy(*args)
+    loop_components, loop_totals = _score_all_loop(*args)
+
+    np.testing.assert_allclose(numpy_components, loop_components)
+    np.testing.assert_allclose(numpy_totals, loop_totals)
+
+def test_match_tiers_agree_with_scalar_tier():
+    """Vectorized tier bucketing must match get_match_tier, including the boundaries"""
+    engine = MatchingEngine()
+    scores = [0.0, 49.9, 50.0, 69.9, 70.0, 84.9, 85.0, 100.0]
+    assert engine.get_match_tiers(scores) == [engine.get_match_tier(s) for s in scores]
+
+def test_rank_jobs_uses_displayed_scores():
+    """Ranking and the min_tier filter must agree with the rounded scores that are shown"""
+    engine = MatchingEngine()
+    # np.round(43.45, 1) is 43.4 while round(43.45, 1) is 43.5
+    totals = np.array([43.4, 43.45, 50.0, 49.95, 49.94])
+    order, scores = engine.rank_jobs(totals)
+
+    assert scores.tolist() == [round(t, 1) for t in totals.tolist()]
+    assert order.tolist() == [2, 3, 4, 1, 0]
+    assert engine.rank_jobs(totals, "fair")[0].tolist() == [2, 3]
+
+def test_job_corpus_invalidated_on_commit_only():
+    """Job posting writes drop the cached corpus when committed, not when flushed or rolled back"""
+    db = TestingSessionLocal()
+    try:
+        corpus = matching.get_job_corpus(db)
+        job = db.get(JobPosting, corpus.jobs[0]["id"])
+        salary_max = job.salary_max
+
+        job.salary_max = salary_max + 1
+        db.flush()
+        assert matching._corpus is corpus
+        db.rollback()
+        assert matching._corpus is corpus
+
+        db.execute(update(JobPosting).where(JobPosting.id == job.id).values(salary_max=salary_max + 1))
+        db.commit()
+        assert matching._corpus is None
+
+        matching.get_job_corpus(db)
+        job = db.get(JobPosting, job.id)
+        job.salary_max = salary_max
+        db.commit()
+        assert matching._corpus is None
+    finally:
+        db.close()
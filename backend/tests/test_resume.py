@@ -0,0 +1,69 @@
+import io
+
+import pypdfium2
+import pytest
+
+from app.services.resume_service import ResumeParser, parse_many
+
+
+def make_pdf(*lines):
+    """Build a one-page PDF that draws each line of text in Helvetica."""
+    stream = "BT /F1 12 Tf 72 720 Td 14 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        "/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return pdf
+
+
+RESUME_PDF = make_pdf("Asha Rao", "asha.rao@example.com", "Skills: Python, FastAPI, Docker")
+
+
+def test_extract_text_from_pdf():
+    """PDFium extracts the text of the page"""
+    text = ResumeParser.extract_text_from_pdf(RESUME_PDF)
+    assert "asha.rao@example.com" in text
+    assert "Python, FastAPI, Docker" in text
+
+def test_extract_text_falls_back_to_pdfplumber(monkeypatch):
+    """When PDFium rejects a file, pdfplumber re-reads it from where the stream started"""
+    class BrokenDocument:
+        def __init__(self, content):
+            content.read(16)  # Leave the stream part-way through, as a failed parse might
+            raise pypdfium2.PdfiumError("Failed to load document")
+
+    expected = ResumeParser._extract_text_from_pdf_pdfplumber(RESUME_PDF)
+    monkeypatch.setattr(pypdfium2, "PdfDocument", BrokenDocument)
+
+    stream = io.BytesIO(b"junk" + RESUME_PDF)
+    stream.seek(4)
+    text = ResumeParser.extract_text_from_pdf(stream)
+    assert "asha.rao@example.com" in text
+    assert text == expected
+
+def test_parse_many_matches_serial_parsing():
+    """The process pool returns the same results as parsing one by one, in input order"""
+    contents = [
+        RESUME_PDF,
+        make_pdf("Vikram Shah", "vikram@example.org", "Skills: Java, Spring Boot, SQL"),
+        make_pdf("Meera Iyer", "meera.iyer@example.in", "Skills: React, TypeScript"),
+    ]
+    results = parse_many(contents, max_workers=2)
+
+    assert results == parse_many(contents, max_workers=1)
+    assert [fields["email"].value for _, fields in results] == [
+        "asha.rao@example.com", "vikram@example.org", "meera.iyer@example.in"
+    ]
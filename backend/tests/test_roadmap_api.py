@@ -1,19 +1,6 @@
-
 import pytest
-from fastapi.testclient import TestClient
-import sys
-import os
-
-# Add backend directory to sys.path to allow importing app
-backend_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
-
-from app.main import app
-
-client = TestClient(app)
 
-def test_get_available_skills():
+def test_get_available_skills(client):
     """Test retrieving the list of available skills."""
     response = client.get("/api/roadmap/skills")
     assert response.status_code == 200
@@ -29,7 +16,7 @@ def test_get_available_skills():
     assert "difficulty" in python_data
     assert "prerequisites" in python_data
 
-def test_generate_roadmap_with_significant_gaps():
+def test_generate_roadmap_with_significant_gaps(client):
     """Test generating a roadmap where the user has few matching skills."""
     # Job 1 (Senior Python Developer) requires Python, FastAPI, PostgreSQL, Docker, AWS
     # User only has "Python".
@@ -58,7 +45,7 @@ def test_generate_roadmap_with_significant_gaps():
     assert "skills" in first_phase
     assert len(first_phase["skills"]) > 0
 
-def test_generate_roadmap_perfect_match():
+def test_generate_roadmap_perfect_match(client):
     """Test generating a roadmap where the user has ALL required and optional skills."""
     # Job 1 Skills
     all_job_skills = [
@@ -81,7 +68,7 @@ def test_generate_roadmap_perfect_match():
     # Check for appropriate success message (API says "already have all" or "ready to apply")
     assert "already have all" in data["summary"].lower() or "ready to apply" in data["motivation_message"].lower()
 
-def test_generate_roadmap_partial_match():
+def test_generate_roadmap_partial_match(client):
     """Test generating a roadmap with some gaps."""
     # User has Python, FastAPI, SQL. Missing Docker, AWS, PostgreSQL specific, etc.
     payload = {
@@ -99,7 +86,7 @@ def test_generate_roadmap_partial_match():
     # Check estimated weeks exists and is positive
     assert data["total_estimated_weeks"] > 0
 
-def test_generate_roadmap_invalid_job_id():
+def test_generate_roadmap_invalid_job_id(client):
     """Test error handling for non-existent job ID."""
     payload = {
         "target_job_id": 999999,